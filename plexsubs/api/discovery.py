@@ -1,36 +1,39 @@
 """Discovery and validation API endpoints."""
 
+import orjson
 from fastapi import APIRouter, Depends, Request
 
+from plexsubs.api.errors import create_error_response
 from plexsubs.api.models import (
     DiscoveryStatusResponse,
     LibrariesListResponse,
-    LibraryLocationResponse,
-    LibraryResponse,
     PathMappingsSuggestionResponse,
-    PathMappingSuggestionResponse,
-    PathTestResponse,
     ValidationReportResponse,
 )
+from plexsubs.api.responses import ORJSONResponse
 from plexsubs.config import get_settings
 from plexsubs.config.settings import Settings
 from plexsubs.core.discovery import PathDiscovery
-from plexsubs.plex.client import PlexClient
 from plexsubs.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-def get_discovery_service(settings: Settings = Depends(get_settings)) -> PathDiscovery:
-    """Get configured PathDiscovery service."""
-    plex_client = PlexClient.from_settings(settings)
-    return PathDiscovery(plex_client, settings.path_mappings)
+# Responses below hand PathDiscovery's dataclasses straight to orjson, which
+# serializes dataclasses natively in a single pass. Their fields mirror the
+# response models, which only document the schema in OpenAPI. Path mappings
+# are spliced in pre-serialized.
 
 
-@router.get("/libraries", response_model=LibrariesListResponse)
+def get_discovery_service(request: Request) -> PathDiscovery:
+    """Get the shared PathDiscovery service created at application startup."""
+    return request.app.state.discovery
+
+
+@router.get("/libraries", responses={200: {"model": LibrariesListResponse}})
 async def discover_libraries(
     discovery: PathDiscovery = Depends(get_discovery_service),
 ):
@@ -41,26 +44,11 @@ async def discover_libraries(
     """
     libraries = discovery.discover_libraries()
 
-    return LibrariesListResponse(
-        libraries=[
-            LibraryResponse(
-                key=lib.key,
-                title=lib.title,
-                type=lib.type,
-                agent=lib.agent,
-                scanner=lib.scanner,
-                language=lib.language,
-                locations=[
-                    LibraryLocationResponse(id=loc.id, path=loc.path) for loc in lib.locations
-                ],
-            )
-            for lib in libraries
-        ]
-    )
+    return ORJSONResponse(content={"libraries": libraries})
 
 
-@router.get("/validate-paths", response_model=ValidationReportResponse)
-@router.post("/validate-paths", response_model=ValidationReportResponse)
+@router.get("/validate-paths", responses={200: {"model": ValidationReportResponse}})
+@router.post("/validate-paths", responses={200: {"model": ValidationReportResponse}})
 async def validate_paths(
     request: Request,
     discovery: PathDiscovery = Depends(get_discovery_service),
@@ -77,8 +65,15 @@ async def validate_paths(
     # Get test paths from request or use defaults
     test_paths: list[str] | None = None
     if request.method == "POST":
-        data = await request.json()
-        test_paths = data.get("test_paths")
+        body = await request.body()
+        # Skip JSON parsing entirely for empty bodies
+        if body.strip():
+            try:
+                data = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                return create_error_response("Invalid JSON body", code="INVALID_REQUEST")
+            if isinstance(data, dict):
+                test_paths = data.get("test_paths")
 
     # If no test paths provided and a specific test file is configured, use it
     if not test_paths and settings.discovery_test_file:
@@ -86,28 +81,18 @@ async def validate_paths(
 
     report = discovery.validate_path_mappings(test_paths)
 
-    return ValidationReportResponse(
-        valid=report.valid,
-        summary=report.summary,
-        tests=[
-            PathTestResponse(
-                plex_path=test.plex_path,
-                mapped_path=test.mapped_path,
-                exists=test.exists,
-                readable=test.readable,
-                writable=test.writable,
-                is_file=test.is_file,
-                is_directory=test.is_directory,
-                error=test.error,
-            )
-            for test in report.tests
-        ],
-        suggestions=report.suggestions,
-        current_mappings=settings.path_mappings,
+    return ORJSONResponse(
+        content={
+            "valid": report.valid,
+            "summary": report.summary,
+            "tests": report.tests,
+            "suggestions": report.suggestions,
+            "current_mappings": orjson.Fragment(settings.path_mappings_json),
+        }
     )
 
 
-@router.get("/suggest-mappings", response_model=PathMappingsSuggestionResponse)
+@router.get("/suggest-mappings", responses={200: {"model": PathMappingsSuggestionResponse}})
 async def suggest_mappings(
     discovery: PathDiscovery = Depends(get_discovery_service),
     settings: Settings = Depends(get_settings),
@@ -119,30 +104,26 @@ async def suggest_mappings(
     """
     suggestions = discovery.suggest_path_mappings()
 
-    return PathMappingsSuggestionResponse(
-        suggestions=[
-            PathMappingSuggestionResponse(
-                plex_prefix=sugg.plex_prefix,
-                suggested_local_prefix=sugg.suggested_local_prefix,
-                confidence=sugg.confidence,
-                reason=sugg.reason,
-            )
-            for sugg in suggestions
-        ],
-        current_mappings=settings.path_mappings,
+    return ORJSONResponse(
+        content={
+            "suggestions": suggestions,
+            "current_mappings": orjson.Fragment(settings.path_mappings_json),
+        }
     )
 
 
-@router.get("/status", response_model=DiscoveryStatusResponse)
+@router.get("/status", responses={200: {"model": DiscoveryStatusResponse}})
 async def discovery_status(settings: Settings = Depends(get_settings)):
     """Get discovery service status and configuration.
 
     Returns:
         JSON response with current configuration.
     """
-    return DiscoveryStatusResponse(
-        enabled=settings.discovery_enabled,
-        validate_on_startup=settings.discovery_validate_on_startup,
-        test_file=settings.discovery_test_file,
-        path_mappings=settings.path_mappings,
+    return ORJSONResponse(
+        content={
+            "enabled": settings.discovery_enabled,
+            "validate_on_startup": settings.discovery_validate_on_startup,
+            "test_file": settings.discovery_test_file,
+            "path_mappings": orjson.Fragment(settings.path_mappings_json),
+        }
     )
@@ -2,23 +2,25 @@
 
 Provides standardized error handling across all API endpoints
 with consistent response formats and proper HTTP status codes.
+
+Error bodies follow the ErrorResponse schema but are emitted as plain dicts;
+the model only documents the shape.
 """
 
+import asyncio
+import functools
+import re
 from typing import Any, Callable
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
 
-from plexsubs.api.models import ErrorResponse
+from plexsubs.api.responses import ORJSONResponse
 from plexsubs.utils.exceptions import (
     ConfigurationError,
-    DownloadError,
-    LanguageDetectionError,
     OpenSubtitlesError,
     PlexAPIError,
     PlexSubtitleError,
     ProviderError,
-    ReleaseMatchingError,
     SubtitleNotFoundError,
 )
 from plexsubs.utils.logging_config import get_logger
@@ -26,22 +28,26 @@ from plexsubs.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-# Mapping of exceptions to HTTP status codes and error codes
-EXCEPTION_HANDLERS: dict[type[Exception], tuple[int, str]] = {
-    ConfigurationError: (500, "CONFIGURATION_ERROR"),
-    PlexAPIError: (503, "PLEX_API_ERROR"),
-    ProviderError: (503, "PROVIDER_ERROR"),
-    OpenSubtitlesError: (503, "OPENSUBTITLES_ERROR"),
-    SubtitleNotFoundError: (404, "SUBTITLE_NOT_FOUND"),
-    DownloadError: (500, "DOWNLOAD_ERROR"),
-    LanguageDetectionError: (500, "LANGUAGE_DETECTION_ERROR"),
-    ReleaseMatchingError: (500, "RELEASE_MATCHING_ERROR"),
-}
+# Message keywords mapped to HTTP status codes, in priority order
+_STATUS_KEYWORDS: tuple[tuple[str, int], ...] = (
+    ("not found", 404),
+    ("no suitable", 404),
+    ("unauthorized", 401),
+    ("authentication", 401),
+    ("invalid", 400),
+    ("bad request", 400),
+    ("timeout", 504),
+)
+
+# Single compiled alternation so the message is scanned once
+_STATUS_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword, _ in _STATUS_KEYWORDS), re.IGNORECASE
+)
 
 
 def create_error_response(
     message: str, code: str = "ERROR", details: dict[str, Any] | None = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create a standardized error response.
 
     Args:
@@ -50,32 +56,28 @@ def create_error_response(
         details: Optional additional details
 
     Returns:
-        JSONResponse with consistent error structure
+        ORJSONResponse with consistent error structure
     """
-    error_data = ErrorResponse(error=message, code=code, details=details)
-    return JSONResponse(
-        content=error_data.model_dump(exclude_none=True),
-        status_code=_get_status_code_from_message(message),
-    )
+    error_data: dict[str, Any] = {"error": message, "code": code}
+    if details is not None:
+        error_data["details"] = details
+    return ORJSONResponse(content=error_data, status_code=_get_status_code_from_message(message))
 
 
 def _get_status_code_from_message(message: str) -> int:
     """Determine appropriate status code from error message."""
-    message_lower = message.lower()
-
-    if "not found" in message_lower or "no suitable" in message_lower:
-        return 404
-    elif "unauthorized" in message_lower or "authentication" in message_lower:
-        return 401
-    elif "invalid" in message_lower or "bad request" in message_lower:
-        return 400
-    elif "timeout" in message_lower:
-        return 504
-    else:
+    matched = {match.group(0).lower() for match in _STATUS_KEYWORD_PATTERN.finditer(message)}
+    if not matched:
         return 500
 
+    # Keywords are checked in priority order, not in order of appearance
+    for keyword, status_code in _STATUS_KEYWORDS:
+        if keyword in matched:
+            return status_code
+    return 500
+
 
-def handle_exception(exc: Exception, operation: str = "") -> JSONResponse:
+def handle_exception(exc: Exception, operation: str = "") -> ORJSONResponse:
     """Handle any exception and return standardized error response.
 
     Args:
@@ -83,29 +85,21 @@ def handle_exception(exc: Exception, operation: str = "") -> JSONResponse:
         operation: Description of the operation that failed
 
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
     # Log the error
     operation_msg = f" during {operation}" if operation else ""
-    logger.error(f"Error{operation_msg}: {exc}")
-
-    # Get error code and status from exception type
-    exc_type = type(exc)
-    if exc_type in EXCEPTION_HANDLERS:
-        status_code, error_code = EXCEPTION_HANDLERS[exc_type]
-    elif isinstance(exc, PlexSubtitleError):
-        status_code, error_code = (500, "PLEXSUBS_ERROR")
+    logger.error("Error%s: %s", operation_msg, exc)
+
+    # Get error code and status from the exception class (honors subclasses)
+    if isinstance(exc, PlexSubtitleError):
+        status_code, error_code = exc.status_code, exc.error_code
     else:
         status_code, error_code = (500, "INTERNAL_ERROR")
 
-    # Create response
-    error_data = ErrorResponse(
-        error=str(exc),
-        code=error_code,
-    )
-
-    return JSONResponse(
-        content=error_data.model_dump(exclude_none=True),
+    # Create response (same shape as ErrorResponse, built without a model)
+    return ORJSONResponse(
+        content={"error": str(exc), "code": error_code},
         status_code=status_code,
     )
 
@@ -128,29 +122,27 @@ def api_error_handler(operation: str) -> Callable:
     """
 
     def decorator(func: Callable) -> Callable:
-        async def async_wrapper(*args, **kwargs) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except Exception as exc:
-                return handle_exception(exc, operation)
+        # Pick the wrapper once at decoration time; functools.wraps keeps the
+        # signature visible to FastAPI's dependency introspection
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as exc:
+                    return handle_exception(exc, operation)
 
+            return async_wrapper
+
+        @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as exc:
                 return handle_exception(exc, operation)
 
-        # Return appropriate wrapper based on function type
-        import asyncio
-
-        if asyncio.iscoroutinefunction(func):
-            async_wrapper.__name__ = func.__name__
-            async_wrapper.__doc__ = func.__doc__
-            return async_wrapper
-        else:
-            sync_wrapper.__name__ = func.__name__
-            sync_wrapper.__doc__ = func.__doc__
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -158,22 +150,24 @@ def api_error_handler(operation: str) -> Callable:
 # FastAPI exception handlers for specific exception types
 
 
-async def plex_api_error_handler(request: Request, exc: PlexAPIError) -> JSONResponse:
+async def plex_api_error_handler(request: Request, exc: PlexAPIError) -> ORJSONResponse:
     """Handle Plex API errors."""
     return handle_exception(exc, "Plex API communication")
 
 
-async def provider_error_handler(request: Request, exc: ProviderError) -> JSONResponse:
+async def provider_error_handler(request: Request, exc: ProviderError) -> ORJSONResponse:
     """Handle provider errors."""
     return handle_exception(exc, "subtitle provider")
 
 
-async def subtitle_not_found_handler(request: Request, exc: SubtitleNotFoundError) -> JSONResponse:
+async def subtitle_not_found_handler(
+    request: Request, exc: SubtitleNotFoundError
+) -> ORJSONResponse:
     """Handle subtitle not found errors."""
     return handle_exception(exc, "subtitle search")
 
 
-async def configuration_error_handler(request: Request, exc: ConfigurationError) -> JSONResponse:
+async def configuration_error_handler(request: Request, exc: ConfigurationError) -> ORJSONResponse:
     """Handle configuration errors."""
     return handle_exception(exc, "configuration validation")
 
@@ -191,7 +185,7 @@ def register_exception_handlers(app) -> None:
     app.add_exception_handler(ConfigurationError, configuration_error_handler)
 
     # Add generic PlexSubtitleError handler for any unhandled custom exceptions
-    async def generic_error_handler(request: Request, exc: PlexSubtitleError) -> JSONResponse:
+    async def generic_error_handler(request: Request, exc: PlexSubtitleError) -> ORJSONResponse:
         return handle_exception(exc)
 
     app.add_exception_handler(PlexSubtitleError, generic_error_handler)
@@ -0,0 +1,21 @@
+"""Fast JSON response classes for API endpoints.
+
+Serializes response content with orjson instead of the stdlib json module.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Drop-in replacement for JSONResponse; orjson encodes in C and returns
+    bytes directly, avoiding the stdlib encoder's escape loop.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,7 +1,11 @@
 """Pydantic settings with environment variable support."""
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
+import orjson
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,16 +17,34 @@ from plexsubs.config.validators import (
 )
 from plexsubs.utils.constants import (
     DEFAULT_MAX_RETRIES,
-    DEFAULT_PATH_MAPPINGS,
     DEFAULT_RETRY_DELAY_SECONDS,
 )
 from plexsubs.utils.path_utils import parse_path_mappings
 
 
+@lru_cache(maxsize=8)
+def _load_path_mappings(value: Optional[str]) -> Mapping[str, str]:
+    """Parse path mappings once per distinct input string.
+
+    Parsing is pure, so repeated loads (reloads, tests) share one read-only
+    mapping. Falls back to the default mapping for common Docker setups.
+
+    Args:
+        value: Path mappings string, or None for the defaults
+
+    Returns:
+        Read-only mapping of Plex paths to local paths
+    """
+    return MappingProxyType(parse_path_mappings(value))
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    # Frozen: one validated instance is shared read-only across requests
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", extra="ignore", frozen=True
+    )
 
     # Plex settings
     plex_url: str = Field(
@@ -110,26 +132,31 @@ class Settings(BaseSettings):
         description="Path mappings in format '/plex/path:/local/path,/plex2:/local2'",
     )
 
-    # Internal path mappings storage
-    _path_mappings: dict[str, str] = {}
+    # Internal storage for values derived once at load time
+    _path_mappings: Mapping[str, str] = {}
+    _path_mappings_json: bytes = b"{}"
+    _languages_list: tuple[str, ...] = ()
 
     def model_post_init(self, __context) -> None:
-        """Load path mappings after initialization."""
-        if self.plex_path_mappings:
-            self._path_mappings = parse_path_mappings(self.plex_path_mappings)
-        else:
-            # Default mapping for common Docker setups
-            self._path_mappings = DEFAULT_PATH_MAPPINGS.copy()
+        """Parse path mappings and language codes after initialization."""
+        self._path_mappings = _load_path_mappings(self.plex_path_mappings or None)
+        self._path_mappings_json = orjson.dumps(dict(self._path_mappings))
+        self._languages_list = tuple(parse_language_codes(self.subtitles_languages))
 
     @property
-    def path_mappings(self) -> dict[str, str]:
-        """Get path mappings."""
+    def path_mappings(self) -> Mapping[str, str]:
+        """Get path mappings (read-only)."""
         return self._path_mappings
 
     @property
-    def languages_list(self) -> list[str]:
-        """Get list of configured language codes."""
-        return parse_language_codes(self.subtitles_languages)
+    def path_mappings_json(self) -> bytes:
+        """Get path mappings pre-serialized as JSON bytes."""
+        return self._path_mappings_json
+
+    @property
+    def languages_list(self) -> tuple[str, ...]:
+        """Get configured language codes, parsed once at load time."""
+        return self._languages_list
 
     @field_validator("plex_url")
     @classmethod
@@ -150,20 +177,13 @@ class Settings(BaseSettings):
         return validate_log_level(v)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get or create settings instance (cached after first load)."""
+    return Settings()
 
 
 def reload_settings() -> Settings:
     """Reload settings from environment."""
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
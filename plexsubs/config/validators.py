@@ -13,7 +13,26 @@ from plexsubs.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Get valid ISO 639-1 language codes
-VALID_ISO639_1_CODES = set(get_supported_languages())
+VALID_ISO639_1_CODES = frozenset(get_supported_languages())
+
+_URL_SCHEMES = ("http://", "https://")
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Comma separator with surrounding whitespace, for language code lists
+_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Accepted string spellings for boolean values
+_BOOL_MAP: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
 
 
 def validate_url(url: str, field_name: str = "url") -> str:
@@ -32,7 +51,7 @@ def validate_url(url: str, field_name: str = "url") -> str:
     if not url:
         raise ValueError(f"{field_name} is required")
 
-    if not url.startswith(("http://", "https://")):
+    if not url.startswith(_URL_SCHEMES):
         raise ValueError(f"{field_name} must start with http:// or https://")
 
     return url
@@ -73,6 +92,10 @@ def validate_language_code(code: str) -> str:
     Raises:
         ValueError: If language code is invalid
     """
+    # Fast path: already normalized
+    if code in VALID_ISO639_1_CODES:
+        return code
+
     code = code.strip().lower()
 
     if not code:
@@ -99,6 +122,10 @@ def validate_language_codes(languages: list[str]) -> list[str]:
     if not languages:
         raise ValueError("At least one language code is required")
 
+    # Fast path: every code is already normalized
+    if all(isinstance(lang, str) and lang in VALID_ISO639_1_CODES for lang in languages):
+        return list(languages)
+
     validated = []
     for lang in languages:
         try:
@@ -126,10 +153,12 @@ def parse_language_codes(value: str | None) -> list[str]:
         return ["en"]
 
     languages = []
-    for lang in value.split(","):
-        lang = lang.strip().lower()
-        if lang and lang in VALID_ISO639_1_CODES:
-            languages.append(lang)
+    for lang in _SPLIT_RE.split(value.strip()):
+        if lang not in VALID_ISO639_1_CODES:
+            lang = lang.lower()
+            if lang not in VALID_ISO639_1_CODES:
+                continue
+        languages.append(lang)
 
     return languages if languages else ["en"]
 
@@ -232,12 +261,12 @@ def validate_log_level(level: str) -> str:
     Raises:
         ValueError: If log level is invalid
     """
-    valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-
     level = level.upper().strip()
 
-    if level not in valid_levels:
-        raise ValueError(f"Invalid log level: {level}. Must be one of: {', '.join(valid_levels)}")
+    if level not in _VALID_LOG_LEVELS:
+        raise ValueError(
+            f"Invalid log level: {level}. Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
+        )
 
     return level
 
@@ -261,12 +290,10 @@ def validate_boolean(value: Any, field_name: str = "value") -> bool:
         return value
 
     if isinstance(value, str):
-        value_lower = value.lower().strip()
-        if value_lower in ("true", "1", "yes", "on"):
-            return True
-        if value_lower in ("false", "0", "no", "off"):
-            return False
-        raise ValueError(f"{field_name} must be a boolean value")
+        result = _BOOL_MAP.get(value.lower().strip())
+        if result is None:
+            raise ValueError(f"{field_name} must be a boolean value")
+        return result
 
     if isinstance(value, int):
         return bool(value)
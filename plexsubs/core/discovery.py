@@ -1,7 +1,10 @@
 """Library discovery and path validation functionality."""
 
-import xml.etree.ElementTree as ET
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from plexsubs.plex.client import LibrarySection, PlexClient
@@ -9,10 +12,29 @@ from plexsubs.utils.constants import COMMON_MEDIA_MOUNTS
 from plexsubs.utils.env_utils import is_running_in_docker
 from plexsubs.utils.logging_config import get_logger
 from plexsubs.utils.path_utils import apply_path_mappings, check_file_permissions
-from plexsubs.utils.xml_utils import MediaPartNavigator
+from plexsubs.utils.xml_utils import get_file_path_from_video, iter_xml_elements
 
 logger = get_logger(__name__)
 
+# Path checks are stat-bound (often on network mounts), so run them concurrently
+_PATH_TEST_WORKERS = 16
+
+# First component of a Plex path (e.g. "media" from /media/movies/...)
+_PREFIX_RE = re.compile(r"^/*([^/]+)")
+
+# Sample files fetched per library, and overall, for path validation
+_SAMPLES_PER_LIBRARY = 3
+_MAX_SAMPLE_PATHS = 9
+
+
+@lru_cache(maxsize=1)
+def _existing_media_mounts() -> tuple[str, ...]:
+    """Return the common media mount points present on this system.
+
+    Checked once per process; mounts do not change while the service runs.
+    """
+    return tuple(mount for mount in COMMON_MEDIA_MOUNTS if os.path.isdir(mount))
+
 
 @dataclass
 class PathTestResult:
@@ -75,7 +97,6 @@ class PathDiscovery:
             ValidationReport with detailed test results and suggestions.
         """
         logger.info("Validating path mappings")
-        tests = []
         suggestions = []
 
         # If no test paths provided, try to get sample from libraries
@@ -96,9 +117,8 @@ class PathDiscovery:
             )
 
         # Test each path
-        for plex_path in test_paths:
-            result = self._test_single_path(plex_path)
-            tests.append(result)
+        with ThreadPoolExecutor(max_workers=min(_PATH_TEST_WORKERS, len(test_paths))) as executor:
+            tests = list(executor.map(self._test_single_path, test_paths))
 
         # Generate summary
         passed = sum(1 for t in tests if t.exists and t.readable)
@@ -171,33 +191,51 @@ class PathDiscovery:
                 if library.type not in ("movie", "show"):
                     continue
 
-                # Get first item from library to test
+                # Get first few items from library to test
                 try:
-                    items = self._get_library_items(library.key)
-                    if items:
-                        # Take first few items as samples
-                        sample_paths.extend(items[:3])
+                    items = self._get_library_items(library.key, limit=_SAMPLES_PER_LIBRARY)
+                    sample_paths.extend(items)
                 except Exception as e:
                     logger.debug(f"Could not get items from library {library.title}: {e}")
 
+                if len(sample_paths) >= _MAX_SAMPLE_PATHS:
+                    break
+
         except Exception as e:
             logger.warning(f"Could not get sample paths from libraries: {e}")
 
         return sample_paths
 
-    def _get_library_items(self, library_key: str) -> list[str]:
-        """Get media file paths from a library using the fluent navigator."""
+    def _get_library_items(self, library_key: str, limit: Optional[int] = None) -> list[str]:
+        """Get media file paths from a library using the fluent navigator.
+
+        The response is parsed incrementally from the raw bytes and each Video
+        element is cleared once read, so large libraries are never held as a
+        full tree.
+
+        Args:
+            library_key: Plex library section key
+            limit: Maximum number of paths to return. Also sent to Plex as
+                the container size so only that many items are fetched.
+
+        Returns:
+            List of Plex file paths
+        """
+        params = None
+        if limit is not None:
+            params = {"X-Plex-Container-Start": 0, "X-Plex-Container-Size": limit}
+
         try:
-            response = self.plex_client.get(f"/library/sections/{library_key}/all")
-            root = ET.fromstring(response.text)
+            response = self.plex_client.get(f"/library/sections/{library_key}/all", params=params)
             paths = []
 
-            # Find Video elements (movies or episodes) and extract paths
-            for video in root.findall(".//Video"):
-                navigator = MediaPartNavigator(video)
-                file_path = navigator.get_file_path()
+            # Stream Video elements (movies or episodes) and extract paths
+            for video in iter_xml_elements(response.content, "Video"):
+                file_path = get_file_path_from_video(video)
                 if file_path:
                     paths.append(file_path)
+                    if limit is not None and len(paths) >= limit:
+                        break
 
             return paths
 
@@ -222,9 +260,9 @@ class PathDiscovery:
             plex_prefixes = set()
             for test in not_found:
                 # Extract prefix from Plex path (e.g., /media from /media/movies/...)
-                parts = test.plex_path.strip("/").split("/")
-                if parts:
-                    plex_prefixes.add(f"/{parts[0]}")
+                match = _PREFIX_RE.match(test.plex_path)
+                if match:
+                    plex_prefixes.add("/" + match.group(1))
 
             if plex_prefixes:
                 prefixes_str = ", ".join(plex_prefixes)
@@ -288,9 +326,9 @@ class PathDiscovery:
                     # Extract root prefix (e.g., /media, M:\\Media, etc.)
                     if path.startswith("/"):
                         # Unix path
-                        parts = path.strip("/").split("/")
-                        if parts:
-                            plex_prefixes.add(f"/{parts[0]}")
+                        match = _PREFIX_RE.match(path)
+                        if match:
+                            plex_prefixes.add("/" + match.group(1))
                     elif ":" in path:
                         # Windows path (e.g., M:\Media)
                         drive = path.split(":")[0]
@@ -313,8 +351,6 @@ class PathDiscovery:
         self, plex_prefix: str, in_docker: bool
     ) -> Optional[PathMappingSuggestion]:
         """Generate a single path mapping suggestion."""
-        import os
-
         # Check if this prefix is already mapped
         if plex_prefix in self.path_mappings:
             return None
@@ -322,16 +358,17 @@ class PathDiscovery:
         # Docker-specific suggestions
         if in_docker:
             # Check if common Docker mount points exist
-            for mount in COMMON_MEDIA_MOUNTS:
-                if os.path.exists(mount) and os.path.isdir(mount):
-                    # Suggest mapping Plex prefix to this mount
-                    return PathMappingSuggestion(
-                        plex_prefix=plex_prefix,
-                        suggested_local_prefix=mount,
-                        confidence="medium",
-                        reason=f"Found {mount} directory in Docker container. "
-                        f"Common pattern: map Plex's '{plex_prefix}' to container's '{mount}'.",
-                    )
+            mounts = _existing_media_mounts()
+            if mounts:
+                mount = mounts[0]
+                # Suggest mapping Plex prefix to this mount
+                return PathMappingSuggestion(
+                    plex_prefix=plex_prefix,
+                    suggested_local_prefix=mount,
+                    confidence="medium",
+                    reason=f"Found {mount} directory in Docker container. "
+                    f"Common pattern: map Plex's '{plex_prefix}' to container's '{mount}'.",
+                )
 
             # Default Docker suggestion
             return PathMappingSuggestion(
@@ -345,7 +382,7 @@ class PathDiscovery:
         # Non-Docker suggestions
         else:
             # Check if Plex prefix exists locally
-            if os.path.exists(plex_prefix) and os.path.isdir(plex_prefix):
+            if os.path.isdir(plex_prefix):
                 return PathMappingSuggestion(
                     plex_prefix=plex_prefix,
                     suggested_local_prefix=plex_prefix,
@@ -357,16 +394,17 @@ class PathDiscovery:
                 )
 
             # Check common local mount points
-            for mount in COMMON_MEDIA_MOUNTS:
-                if os.path.exists(mount) and os.path.isdir(mount):
-                    return PathMappingSuggestion(
-                        plex_prefix=plex_prefix,
-                        suggested_local_prefix=mount,
-                        confidence="low",
-                        reason=(
-                            f"Path '{plex_prefix}' not found locally. "
-                            f"Check if your media is mounted at {mount}."
-                        ),
-                    )
+            mounts = _existing_media_mounts()
+            if mounts:
+                mount = mounts[0]
+                return PathMappingSuggestion(
+                    plex_prefix=plex_prefix,
+                    suggested_local_prefix=mount,
+                    confidence="low",
+                    reason=(
+                        f"Path '{plex_prefix}' not found locally. "
+                        f"Check if your media is mounted at {mount}."
+                    ),
+                )
 
         return None
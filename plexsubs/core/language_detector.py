@@ -1,19 +1,33 @@
 """Language detection for subtitle verification."""
 
+import codecs
+import os
 import re
+from functools import lru_cache
 from typing import Optional
 
-from langdetect import detect
-
+from plexsubs.utils.constants import LANGUAGE_DETECTION_SAMPLE_SIZE
 from plexsubs.utils.language_codes import verify_language_match
 from plexsubs.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Subtitle indices, timing lines and HTML tags fused into a single
+# alternation so cleaning is one regex pass over the content
+_CLEAN_PATTERN = re.compile(
+    r"^\d+$"  # subtitle indices (lines that are just numbers)
+    r"|\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}"  # timing lines
+    r"|<[^>]+>",  # HTML tags
+    re.MULTILINE,
+)
+
 
 def detect_subtitle_language(file_path: str) -> Optional[str]:
     """Detect the actual language of a subtitle file.
 
+    Results are cached per (path, mtime, size), so re-verifying an unchanged
+    file does not re-read or re-detect it.
+
     Args:
         file_path: Path to subtitle file
 
@@ -21,9 +35,25 @@ def detect_subtitle_language(file_path: str) -> Optional[str]:
         Detected language code or None if detection failed
     """
     try:
-        # Read subtitle file
-        with open(file_path, encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        stat = os.stat(file_path)
+    except OSError as e:
+        logger.warning(f"Language detection failed: {e}")
+        return None
+
+    return _detect_language_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _detect_language_cached(file_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Detect subtitle language; mtime_ns and size only serve as cache keys."""
+    # Imported lazily: langdetect is heavy and only needed once a subtitle is verified
+    from langdetect import detect
+
+    try:
+        # Read only the head of the subtitle file
+        with open(file_path, "rb") as f:
+            raw = f.read(LANGUAGE_DETECTION_SAMPLE_SIZE)
+        content = _decode_subtitle_bytes(raw)
 
         # Clean text for detection
         text = _clean_subtitle_text(content)
@@ -41,24 +71,28 @@ def detect_subtitle_language(file_path: str) -> Optional[str]:
         return None
 
 
-def _clean_subtitle_text(content: str) -> str:
-    """Clean subtitle content for language detection.
+def _decode_subtitle_bytes(raw: bytes) -> str:
+    """Decode raw subtitle bytes, honouring a UTF-8 or UTF-16 BOM.
 
-    Removes timing info, subtitle numbers, and HTML tags.
-    """
-    # Remove subtitle indices (lines that are just numbers)
-    text = re.sub(r"^\d+$", "", content, flags=re.MULTILINE)
+    Args:
+        raw: Raw bytes from the start of a subtitle file
 
-    # Remove timing lines (00:00:00,000 --> 00:00:00,000)
-    text = re.sub(r"\d{2}:\d{2}:\d{2},\d{3}\s*--\u003e\s*\d{2}:\d{2}:\d{2},\d{3}", "", text)
+    Returns:
+        Decoded text; undecodable bytes become U+FFFD
+    """
+    if raw.startswith(codecs.BOM_UTF8):
+        return raw[len(codecs.BOM_UTF8) :].decode("utf-8", errors="replace")
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return raw.decode("utf-16", errors="replace")
+    return raw.decode("utf-8", errors="replace")
 
-    # Remove HTML tags
-    text = re.sub(r"<[^\u003e]+>", "", text)
 
-    # Clean up whitespace
-    text = " ".join(text.split())
+def _clean_subtitle_text(content: str) -> str:
+    """Clean subtitle content for language detection.
 
-    return text
+    Removes timing info, subtitle numbers, and HTML tags.
+    """
+    return " ".join(_CLEAN_PATTERN.sub("", content).split())
 
 
 def verify_language(file_path: str, expected_language: str) -> bool:
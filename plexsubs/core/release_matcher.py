@@ -1,21 +1,99 @@
 """Release group extraction and matching."""
 
-from guessit import guessit
+import re
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Optional
 
 from plexsubs.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Fast-path patterns for well-formed scene names (Title.Year.1080p.BluRay.x264-GROUP)
+_QUALITY_RE = re.compile(r"\b(480p|576p|720p|1080p|1080i|2160p)\b", re.IGNORECASE)
+_SOURCE_RE = re.compile(
+    r"\b(WEB[-. ]?DL|WEBRip|WEB|BluRay|BDRip|BRRip|DVDRip|HDTV)\b", re.IGNORECASE
+)
+_CODEC_RE = re.compile(r"\b(x26[45]|H\.?26[45]|HEVC|AVC|XviD)\b", re.IGNORECASE)
+# Qualifiers that guessit folds into a multi-word source (ULTRA HD BLU-RAY)
+_QUALIFIER_RE = re.compile(r"\b(UHD|Ultra|Remux)\b", re.IGNORECASE)
+_GROUP_RE = re.compile(r"-([A-Za-z0-9]+)(?:\.[a-z0-9]+)?$")
+_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+
+# Canonical (uppercased) guessit values, keyed by token without separators
+_SOURCE_NAMES = {
+    "WEBDL": "WEB",
+    "WEBRIP": "WEB",
+    "WEB": "WEB",
+    "BLURAY": "BLU-RAY",
+    "BDRIP": "BLU-RAY",
+    "BRRIP": "BLU-RAY",
+    "DVDRIP": "DVD",
+    "HDTV": "HDTV",
+}
+_CODEC_NAMES = {
+    "X264": "H.264",
+    "H264": "H.264",
+    "AVC": "H.264",
+    "X265": "H.265",
+    "H265": "H.265",
+    "HEVC": "H.265",
+    "XVID": "XVID",
+}
+
+
+def _fast_release_info(filename: str) -> Optional[tuple[str, ...]]:
+    """Extract release info from a well-formed scene name without guessit.
+
+    Only succeeds when all four fields are present, the release group
+    directly follows the codec (``x264-GROUP``), and exactly one plain source
+    appears outside the release group. Names with UHD/Ultra/Remux qualifiers
+    or several sources are left to guessit, which reports them differently.
 
-def extract_release_info(filename: str) -> list[str]:
-    """Extract release group and quality info from filename using guessit.
+    Args:
+        filename: Media filename
+
+    Returns:
+        Tuple of release info strings, or None if guessit is needed
+    """
+    quality = _QUALITY_RE.findall(filename)
+    sources = list(_SOURCE_RE.finditer(filename))
+    codecs = list(_CODEC_RE.finditer(filename))
+    group = _GROUP_RE.search(filename)
+    if not (quality and len(sources) == 1 and codecs and group):
+        return None
+    if group.start() != codecs[-1].end() or sources[0].end() > group.start():
+        return None
+    if _QUALIFIER_RE.search(filename):
+        return None
+
+    source = _SOURCE_NAMES[re.sub(r"[-. ]", "", sources[0].group(1).upper())]
+    codec = _CODEC_NAMES[codecs[-1].group(1).upper().replace(".", "")]
+    return tuple(dict.fromkeys((group.group(1).upper(), quality[-1].upper(), source, codec)))
+
+
+@lru_cache(maxsize=8192)
+def extract_release_info(filename: str) -> tuple[str, ...]:
+    """Extract release group and quality info from filename.
+
+    Well-formed scene names are handled by a regex fast path; anything else
+    falls back to guessit. Results are memoized per filename; use
+    ``extract_release_info.cache_clear()`` to reset.
 
     Args:
         filename: Media filename
 
     Returns:
-        List of release info strings
+        Tuple of release info strings
     """
+    fast = _fast_release_info(filename)
+    if fast is not None:
+        logger.debug(f"Extracted release info: {fast}")
+        return fast
+
+    # Imported lazily: guessit pulls in rebulk/babelfish and hundreds of rules
+    from guessit import guessit
+
     try:
         result = guessit(filename)
         release_info = []
@@ -41,30 +119,40 @@ def extract_release_info(filename: str) -> list[str]:
             release_info.append(result["video_codec"].upper())
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_info = []
-        for item in release_info:
-            if item not in seen:
-                seen.add(item)
-                unique_info.append(item)
+        unique_info = tuple(dict.fromkeys(release_info))
 
         logger.debug(f"Extracted release info: {unique_info}")
         return unique_info
 
     except Exception as e:
         logger.warning(f"Failed to extract release info from '{filename}': {e}")
-        return []
+        return ()
+
+
+def _source_stems(tokens: list[str]) -> Iterator[str]:
+    """Yield the bare source for rip tokens (``WEBRIP`` -> ``WEB``)."""
+    for token in tokens:
+        if token.endswith("RIP") and len(token) > 3:
+            yield token[:-3]
+        elif token == "WEBDL":
+            yield "WEB"
 
 
 def calculate_match_score(
-    subtitle_release: str, subtitle_filename: str, media_release_groups: list[str]
+    subtitle_release: str, subtitle_filename: str, media_release_groups: tuple[str, ...]
 ) -> tuple:
     """Calculate how well a subtitle matches the media release.
 
+    Single-token groups (``SPARKS``, ``1080P``) must appear as a whole token;
+    groups containing separators (``BLU-RAY``, ``H.264``) are matched as
+    substrings. Rip and ``WEBDL`` tokens also count as their bare source, so
+    ``WEBRIP`` matches ``WEB`` and ``DVDRIP`` matches ``DVD``.
+
     Args:
         subtitle_release: Release name from subtitle
         subtitle_filename: Filename from subtitle
-        media_release_groups: Release groups from media filename
+        media_release_groups: Uppercased release groups from media filename,
+            as returned by extract_release_info
 
     Returns:
         Tuple of (score, is_perfect_match)
@@ -72,12 +160,15 @@ def calculate_match_score(
     if not media_release_groups:
         return 0.0, False
 
-    combined = f"{subtitle_release} {subtitle_filename}".upper()
+    combined = (subtitle_release + " " + subtitle_filename).upper()
+    tokens = _TOKEN_RE.findall(combined)
+    combined_tokens = frozenset(tokens).union(_source_stems(tokens))
 
-    matches = 0
-    for group in media_release_groups:
-        if group.upper() in combined:
-            matches += 1
+    matches = sum(
+        1
+        for group in media_release_groups
+        if group in combined_tokens or (not group.isalnum() and group in combined)
+    )
 
     # Perfect match if all release groups found
     score = matches / len(media_release_groups) if media_release_groups else 0.0
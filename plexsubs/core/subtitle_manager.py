@@ -1,21 +1,43 @@
 """Subtitle manager - orchestrates downloading from multiple providers."""
 
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Optional
+from uuid import uuid4
+
+import requests
 
 from plexsubs.config.settings import Settings
 from plexsubs.core.language_detector import verify_language
 from plexsubs.core.release_matcher import extract_release_info
 from plexsubs.providers import BaseProvider, OpenSubtitlesProvider
 from plexsubs.providers.base import SubtitleResult
-from plexsubs.utils.constants import SUBTITLE_EXTENSIONS
-from plexsubs.utils.exceptions import ProviderError
+from plexsubs.utils.constants import (
+    DIR_SNAPSHOT_CACHE_SIZE,
+    SEARCH_MISS_CACHE_SIZE,
+    SEARCH_MISS_TTL_SECONDS,
+    SUBTITLE_EXTENSIONS,
+)
+from plexsubs.utils.exceptions import DownloadError, LanguageDetectionError, ProviderError
 from plexsubs.utils.language_codes import to_plex_language_code
 from plexsubs.utils.logging_config import get_logger
 from plexsubs.utils.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Upper bound on languages searched concurrently per media file
+_MAX_LANGUAGE_SEARCHES = 4
+
+
+def _log_download_retry(attempt: int, delay: float, exception: Exception) -> None:
+    """Log a transient download failure before it is retried."""
+    logger.warning(
+        "Download failed on attempt %s (%s), retrying in %ss...", attempt + 1, exception, delay
+    )
+
 
 class SubtitleManager:
     """Manages subtitle downloading from multiple providers."""
@@ -23,6 +45,22 @@ class SubtitleManager:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.providers: list[BaseProvider] = []
+        self._languages = settings.languages_list
+        if not self._languages:
+            logger.warning("No languages configured")
+        # Filename suffixes (".nl.srt", ...) per language, in extension priority order
+        self._subtitle_suffixes: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+            (lang, tuple(f".{lang}{ext}" for ext in SUBTITLE_EXTENSIONS))
+            for lang in self._languages
+        )
+        # Plex (ISO 639-2/T) code reported for each configured language
+        self._plex_language_codes = {lang: to_plex_language_code(lang) for lang in self._languages}
+        # (imdb_id or media name, language) -> expiry of a search that found nothing
+        self._search_misses: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._search_misses_lock = threading.Lock()
+        # media directory -> (mtime_ns, filenames) from the last listing
+        self._dir_snapshots: OrderedDict[str, tuple[int, frozenset[str]]] = OrderedDict()
+        self._dir_snapshots_lock = threading.Lock()
         self._init_providers()
 
     def _should_skip_first_language(self, existing: dict[str, str], first_lang: str) -> dict | None:
@@ -37,7 +75,9 @@ class SubtitleManager:
         """
         if first_lang in existing:
             logger.info(
-                f"Subtitle for first language ({first_lang}) already exists: {existing[first_lang]}"
+                "Subtitle for first language (%s) already exists: %s",
+                first_lang,
+                existing[first_lang],
             )
             # Check if we should try to upgrade with a perfect match
             if not self.settings.subtitles_use_release_matching:
@@ -68,16 +108,28 @@ class SubtitleManager:
         if is_first and first_lang in existing:
             if not self.settings.subtitles_use_release_matching:
                 logger.info(
-                    f"Release matching disabled, keeping existing subtitle for {first_lang}"
+                    "Release matching disabled, keeping existing subtitle for %s", first_lang
                 )
                 return {"success": False, "existing": existing[first_lang]}
             if not self.settings.subtitles_upgrade_on_perfect_match:
                 logger.info(
-                    f"Upgrade on perfect match disabled, keeping existing subtitle for {first_lang}"
+                    "Upgrade on perfect match disabled, keeping existing subtitle for %s",
+                    first_lang,
                 )
                 return {"success": False, "existing": existing[first_lang]}
             # Continue to _try_download to check for perfect match upgrades
             return None
+
+        # An existing subtitle can only be replaced through an upgrade; with both
+        # upgrade paths disabled, searching providers would be wasted work
+        existing_path = existing.get(current_lang)
+        if (
+            existing_path
+            and not self.settings.subtitles_upgrade_on_perfect_match
+            and not self.settings.subtitles_upgrade_on_popular
+        ):
+            logger.info("Upgrades disabled, keeping existing subtitle for %s", current_lang)
+            return {"success": False, "existing": existing_path}
         return None
 
     def _init_providers(self) -> None:
@@ -92,7 +144,7 @@ class SubtitleManager:
             )
         )
 
-        logger.info(f"Initialized {len(self.providers)} subtitle provider(s)")
+        logger.info("Initialized %s subtitle provider(s)", len(self.providers))
 
     def _get_existing_subtitles(self, media_dir: str, media_name: str) -> dict[str, str]:
         """Check for existing subtitle files.
@@ -101,18 +153,58 @@ class SubtitleManager:
             Dict mapping language codes to file paths
         """
         existing = {}
-        languages = self.settings.languages_list
+        names = self._list_directory(media_dir or ".")
+        if not names:
+            return existing
 
         # Check all configured languages
-        for lang in languages:
-            for ext in SUBTITLE_EXTENSIONS:
-                path = os.path.join(media_dir, f"{media_name}.{lang}{ext}")
-                if os.path.exists(path):
-                    existing[lang] = path
+        for lang, suffixes in self._subtitle_suffixes:
+            for suffix in suffixes:
+                if media_name + suffix in names:
+                    existing[lang] = os.path.join(media_dir, media_name + suffix)
                     break
 
         return existing
 
+    def _list_directory(self, media_dir: str) -> frozenset[str]:
+        """List a directory, reusing the previous listing while its mtime is unchanged.
+
+        Returns:
+            Filenames in the directory, empty if it cannot be read
+        """
+        try:
+            mtime = os.stat(media_dir).st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        with self._dir_snapshots_lock:
+            snapshot = self._dir_snapshots.get(media_dir)
+            if snapshot is not None and snapshot[0] == mtime:
+                self._dir_snapshots.move_to_end(media_dir)
+                return snapshot[1]
+
+        try:
+            with os.scandir(media_dir) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            return frozenset()
+
+        with self._dir_snapshots_lock:
+            self._dir_snapshots[media_dir] = (mtime, names)
+            self._dir_snapshots.move_to_end(media_dir)
+            if len(self._dir_snapshots) > DIR_SNAPSHOT_CACHE_SIZE:
+                self._dir_snapshots.popitem(last=False)
+        return names
+
+    def _forget_directory(self, media_dir: str) -> None:
+        """Drop a directory's listing after this process changed its contents.
+
+        Directory mtimes have coarse granularity on some filesystems, so a
+        file written in the same tick as the listing would otherwise be missed.
+        """
+        with self._dir_snapshots_lock:
+            self._dir_snapshots.pop(media_dir or ".", None)
+
     def download_subtitles(
         self,
         media_path: str,
@@ -126,15 +218,13 @@ class SubtitleManager:
         Returns:
             Dict with download result information
         """
-        media_dir = os.path.dirname(media_path)
-        media_name = os.path.splitext(os.path.basename(media_path))[0]
+        media_dir, media_file = os.path.split(media_path)
+        media_name = os.path.splitext(media_file)[0]
 
-        logger.info(f"Processing: {media_name}")
+        logger.info("Processing: %s", media_name)
 
-        # Get configured languages
-        languages = self.settings.languages_list
+        languages = self._languages
         if not languages:
-            logger.warning("No languages configured")
             return {"success": False}
 
         # Check for existing subtitles
@@ -151,59 +241,117 @@ class SubtitleManager:
         if self.settings.subtitles_use_release_matching:
             release_groups = extract_release_info(media_name)
             if release_groups:
-                logger.info(f"Release groups detected: {release_groups}")
+                logger.info("Release groups detected: %s", release_groups)
 
-        # Try each language in order
+        # Check which languages need a search (already exist and not upgrading)
+        search_languages = []
         for i, lang in enumerate(languages):
-            is_first = i == 0
-
-            # Check if we should skip this language (already exists and not upgrading)
-            skip_check = self._should_skip_language_check(is_first, first_lang, existing, lang)
+            skip_check = self._should_skip_language_check(i == 0, first_lang, existing, lang)
             if skip_check:
-                return skip_check
-
-            # Try downloading this language
-            if not is_first:
-                logger.info(f"No subtitles found for previous languages, trying {lang}")
+                if i == 0:
+                    return skip_check
+                continue
+            search_languages.append(lang)
 
-            result = self._try_download(
-                media_dir=media_dir,
-                media_name=media_name,
-                title=title,
-                year=year,
-                imdb_id=imdb_id,
-                language=lang,
-                release_groups=release_groups,
-                existing_path=existing.get(lang),
-            )
+        # Search all languages concurrently, then try them in configured order
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(search_languages), _MAX_LANGUAGE_SEARCHES)
+        )
+        try:
+            searches = {
+                lang: executor.submit(
+                    self._search_providers,
+                    title=title,
+                    year=year,
+                    imdb_id=imdb_id,
+                    language=lang,
+                    release_groups=release_groups,
+                    media_name=media_name,
+                )
+                for lang in search_languages
+            }
+
+            for i, lang in enumerate(search_languages):
+                if i > 0:
+                    logger.info("No subtitles found for previous languages, trying %s", lang)
+
+                result = self._try_download(
+                    media_dir=media_dir,
+                    media_name=media_name,
+                    language=lang,
+                    all_results=searches[lang].result(),
+                    existing_path=existing.get(lang),
+                )
 
-            if result["success"]:
-                return result
+                if result["success"]:
+                    return result
+        finally:
+            # Don't wait on searches for languages we no longer need
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Nothing found for any language
         logger.warning("No subtitles found from any provider for any language")
         return {"success": False}
 
-    def _try_download(
+    def _is_search_miss(self, key: tuple[str, str]) -> bool:
+        """Check whether a recent search for this media and language found nothing."""
+        with self._search_misses_lock:
+            expiry = self._search_misses.get(key)
+            if expiry is None:
+                return False
+            if expiry <= time.monotonic():
+                del self._search_misses[key]
+                return False
+            return True
+
+    def _record_search_miss(self, key: tuple[str, str]) -> None:
+        """Remember that a search found nothing, evicting the oldest entry if full."""
+        with self._search_misses_lock:
+            self._search_misses[key] = time.monotonic() + SEARCH_MISS_TTL_SECONDS
+            self._search_misses.move_to_end(key)
+            if len(self._search_misses) > SEARCH_MISS_CACHE_SIZE:
+                self._search_misses.popitem(last=False)
+
+    def _search_providers(
         self,
-        media_dir: str,
-        media_name: str,
         title: str,
         year: Optional[int],
         imdb_id: Optional[str],
         language: str,
-        release_groups: Optional[list[str]],
-        existing_path: Optional[str],
-    ) -> dict:
-        """Try to download subtitles for a specific language."""
+        release_groups: Optional[tuple[str, ...]],
+        media_name: str,
+    ) -> list[tuple]:
+        """Search all providers concurrently for a specific language.
+
+        As soon as any provider returns a perfect release match, searches that
+        are still outstanding are abandoned; nothing else can outrank it.
 
-        # Search all providers
-        all_results: list[tuple] = []  # (provider, result, token)
+        Searches where every provider answered with no results are remembered
+        for SEARCH_MISS_TTL_SECONDS, so repeated webhooks for the same media
+        don't hit the providers again. Entries are keyed on what providers are
+        queried by (IMDb ID, else media name), so a renamed file without an
+        IMDb ID is searched afresh; subtitles uploaded in the meantime are
+        found once the entry expires. Providers are fixed per instance, so a
+        provider change (which needs a restart) starts with an empty cache.
 
-        for provider in self.providers:
-            try:
-                logger.info(f"Searching {provider.name} for {language} subtitles...")
-                results, token = provider.search(
+        Returns:
+            List of unique (provider, result, token) tuples, in provider order
+        """
+        miss_key = (imdb_id or media_name, language)
+        if self._is_search_miss(miss_key):
+            logger.info("Skipping %s search, nothing was found recently", language)
+            return []
+
+        all_results: list[tuple] = []
+        seen: set[tuple[str, str]] = set()
+        failed = False
+
+        executor = ThreadPoolExecutor(max_workers=max(len(self.providers), 1))
+        try:
+            futures = [
+                executor.submit(
+                    self._search_provider,
+                    provider,
                     title=title,
                     year=year,
                     imdb_id=imdb_id,
@@ -211,16 +359,63 @@ class SubtitleManager:
                     release_groups=release_groups,
                     filename=media_name,
                 )
+                for provider in self.providers
+            ]
+
+            completed: set[Future] = set()
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                completed |= done
+                if any(entry[1].is_perfect_match for f in done for entry in f.result() or ()):
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                for result in results:
-                    all_results.append((provider, result, token))
-
-            except Exception as e:
-                logger.error(f"Provider {provider.name} search failed: {e}")
+        # Collect in provider order so ties sort deterministically,
+        # dropping files a provider returned more than once
+        for future in futures:
+            if future not in completed:
+                continue
+            entries = future.result()
+            if entries is None:
+                failed = True
                 continue
+            for entry in entries:
+                result = entry[1]
+                key = (result.provider, result.id or result.filename)
+                if key not in seen:
+                    seen.add(key)
+                    all_results.append(entry)
+
+        # Don't remember misses caused by provider errors
+        if not all_results and not failed:
+            self._record_search_miss(miss_key)
 
+        return all_results
+
+    def _try_download(
+        self,
+        media_dir: str,
+        media_name: str,
+        language: str,
+        all_results: list[tuple],
+        existing_path: Optional[str],
+    ) -> dict:
+        """Try to download subtitles for a specific language.
+
+        Args:
+            media_dir: Directory of the media file
+            media_name: Media filename without extension
+            language: Language code being tried
+            all_results: (provider, result, token) tuples from _search_providers
+            existing_path: Path of an existing subtitle for this language, if any
+
+        Returns:
+            Dict with download result information
+        """
         if not all_results:
-            logger.info(f"No {language} subtitles found")
+            logger.info("No %s subtitles found", language)
             return {"success": False}
 
         # Sort by perfect match first, then by download count (descending), then by score
@@ -228,26 +423,28 @@ class SubtitleManager:
             key=lambda x: (not x[1].is_perfect_match, -x[1].download_count, -x[1].score)
         )
 
-        # Check if we should upgrade existing subtitle
-        has_perfect_match = any(r[1].is_perfect_match for r in all_results)
+        # Check if we should upgrade existing subtitle; perfect matches sort first
         best_result = all_results[0][1]
+        has_perfect_match = best_result.is_perfect_match
 
         if existing_path and not has_perfect_match:
             # No perfect match, but check if we should upgrade to a popular subtitle
             if self.settings.subtitles_upgrade_on_popular:
                 if best_result.download_count >= self.settings.subtitles_popular_download_threshold:
                     logger.info(
-                        f"No perfect match, but found popular subtitle with "
-                        f"{best_result.download_count} downloads (threshold: "
-                        f"{self.settings.subtitles_popular_download_threshold})"
+                        "No perfect match, but found popular subtitle with "
+                        "%s downloads (threshold: %s)",
+                        best_result.download_count,
+                        self.settings.subtitles_popular_download_threshold,
                     )
                     # Continue to download the most popular subtitle
                 else:
                     logger.info(
-                        f"Existing subtitle found and no perfect match available. "
-                        f"Best alternative has only {best_result.download_count} downloads "
-                        f"(threshold: {self.settings.subtitles_popular_download_threshold}), "
-                        f"skipping download"
+                        "Existing subtitle found and no perfect match available. "
+                        "Best alternative has only %s downloads (threshold: %s), "
+                        "skipping download",
+                        best_result.download_count,
+                        self.settings.subtitles_popular_download_threshold,
                     )
                     return {"success": False, "existing": existing_path}
             else:
@@ -271,16 +468,16 @@ class SubtitleManager:
                 # Only skip if we're not in "upgrade on popular" mode or this isn't
                 # the best popular result
                 if not self.settings.subtitles_upgrade_on_popular:
-                    logger.debug(f"Skipping non-perfect match from {provider.name}")
+                    logger.debug("Skipping non-perfect match from %s", provider.name)
                     continue
                 # In upgrade_on_popular mode, only try the first (most popular) result
                 if result != best_result:
-                    logger.debug(f"Skipping less popular match from {provider.name}")
+                    logger.debug("Skipping less popular match from %s", provider.name)
                     continue
 
             output_path = os.path.join(media_dir, f"{media_name}.{language}.srt")
 
-            logger.info(f"Attempting download from {provider.name}: {result.filename}")
+            logger.info("Attempting download from %s: %s", provider.name, result.filename)
 
             download_result = self._download_with_retry(
                 provider=provider,
@@ -294,10 +491,48 @@ class SubtitleManager:
             if download_result.get("success"):
                 return download_result
 
-        logger.warning(f"All download attempts failed for {language}")
+        logger.warning("All download attempts failed for %s", language)
         return {"success": False}
 
-    @retry_with_backoff(max_retries=3, exceptions=(Exception,), on_retry=None)
+    def _search_provider(
+        self,
+        provider: BaseProvider,
+        title: str,
+        year: Optional[int],
+        imdb_id: Optional[str],
+        language: str,
+        release_groups: Optional[tuple[str, ...]],
+        filename: str,
+    ) -> Optional[list[tuple]]:
+        """Search a single provider, isolating its failures from the others.
+
+        Returns:
+            List of (provider, result, token) tuples, or None if the search failed
+        """
+        try:
+            logger.info("Searching %s for %s subtitles...", provider.name, language)
+            results, token = provider.search(
+                title=title,
+                year=year,
+                imdb_id=imdb_id,
+                language=language,
+                release_groups=release_groups,
+                filename=filename,
+            )
+        except Exception as e:
+            logger.error("Provider %s search failed: %s", provider.name, e)
+            return None
+
+        return [(provider, result, token) for result in results]
+
+    # Providers raise DownloadError for transient faults, and only those are
+    # retried; a wrong-language file would just fail verification again
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=2.0,
+        exceptions=(DownloadError, requests.exceptions.RequestException),
+        on_retry=_log_download_retry,
+    )
     def _download_and_verify(
         self,
         provider: BaseProvider,
@@ -308,21 +543,34 @@ class SubtitleManager:
     ) -> bool:
         """Download and verify a subtitle file.
 
+        The subtitle is written to a uniquely named ``.part`` file next to
+        ``output_path`` and only renamed once verified, so a partial or
+        wrong-language file is never visible under the final name, and
+        concurrent downloads of the same subtitle never share a temp file.
+
         Returns:
             True if download and verification succeeded
         """
-        success = provider.download(subtitle, output_path, token)
+        # Created up front with O_EXCL so the name is ours alone; the kernel
+        # applies the process umask to the 0o666 mode
+        part_path = f"{output_path}.{uuid4().hex}.part"
+        os.close(os.open(part_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
 
-        if not success:
-            return False
+        try:
+            if not provider.download(subtitle, part_path, token):
+                return False
 
-        # Verify language if possible
-        if not verify_language(output_path, language):
-            logger.warning("Language verification failed, removing file")
-            os.remove(output_path)
-            raise Exception("Language verification failed")
+            # Verify language if possible
+            if not verify_language(part_path, language):
+                logger.warning("Language verification failed, removing file")
+                raise LanguageDetectionError("Language verification failed")
 
-        return True
+            os.replace(part_path, output_path)
+            self._forget_directory(os.path.dirname(output_path))
+            return True
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
 
     def _download_with_retry(
         self,
@@ -342,25 +590,26 @@ class SubtitleManager:
                 if existing_path and existing_path != output_path and subtitle.is_perfect_match:
                     try:
                         os.remove(existing_path)
-                        logger.info(f"Removed old subtitle: {existing_path}")
+                        self._forget_directory(os.path.dirname(existing_path))
+                        logger.info("Removed old subtitle: %s", existing_path)
                     except Exception as e:
-                        logger.warning(f"Could not remove old subtitle: {e}")
+                        logger.warning("Could not remove old subtitle: %s", e)
 
-                logger.info(f"Successfully downloaded {language} subtitle from {provider.name}")
+                logger.info("Successfully downloaded %s subtitle from %s", language, provider.name)
 
                 return {
                     "success": True,
                     "path": output_path,
                     "language": language,
-                    "language_code": to_plex_language_code(language),
+                    "language_code": self._plex_language_codes[language],
                     "provider": provider.name,
                     "upgraded": existing_path is not None and subtitle.is_perfect_match,
                 }
 
         except ProviderError as e:
             # Provider errors are not retryable
-            logger.error(f"Provider error from {provider.name}: {e}")
+            logger.error("Provider error from %s: %s", provider.name, e)
         except Exception as e:
-            logger.error(f"Download from {provider.name} failed: {e}")
+            logger.error("Download from %s failed: %s", provider.name, e)
 
         return {"success": False}
@@ -2,8 +2,9 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Form
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 
 from plexsubs import __version__
 from plexsubs.api.discovery import router as discovery_router
@@ -13,14 +14,44 @@ from plexsubs.api.models import (
     HealthResponse,
     WebhookIgnoredResponse,
 )
+from plexsubs.api.responses import ORJSONResponse
 from plexsubs.config import get_settings
 from plexsubs.core import SubtitleManager
 from plexsubs.core.discovery import PathDiscovery
 from plexsubs.plex import PlexClient, WebhookHandler
+from plexsubs.plex.webhook import extract_webhook_payload
 from plexsubs.utils import get_logger, setup_logging
+from plexsubs.utils.constants import PLEX_WEBHOOK_EVENTS, PROCESSABLE_EVENTS
 
 logger = get_logger(__name__)
 
+# Pre-serialized bodies for webhook responses that never vary
+_IGNORED_EVENT_BODIES: dict[str, bytes] = {
+    event: orjson.dumps(WebhookIgnoredResponse(event=event).model_dump())
+    for event in PLEX_WEBHOOK_EVENTS
+    if event not in PROCESSABLE_EVENTS
+}
+_MISSING_PAYLOAD_BODY: bytes = orjson.dumps(
+    WebhookIgnoredResponse(status="error", event="missing_payload").model_dump()
+)
+
+
+# The webhook body is parsed by hand, so describe Plex's form for the docs
+_WEBHOOK_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"payload": {"type": "string"}},
+                    "required": ["payload"],
+                }
+            }
+        },
+    }
+}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,13 +60,13 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
 
     logger.info("=" * 60)
-    logger.info(f"plexsubs - Plex Subtitle Webhook Server v{__version__}")
+    logger.info("plexsubs - Plex Subtitle Webhook Server v%s", __version__)
     logger.info("=" * 60)
-    logger.info(f"Plex URL: {settings.plex_url}")
-    logger.info(f"Languages: {', '.join(settings.languages_list)}")
-    logger.info(f"Auto-select: {settings.subtitles_auto_select}")
-    logger.info(f"Release matching: {settings.subtitles_use_release_matching}")
-    logger.info(f"Webhook endpoint: {settings.server_webhook_path}")
+    logger.info("Plex URL: %s", settings.plex_url)
+    logger.info("Languages: %s", ", ".join(settings.languages_list))
+    logger.info("Auto-select: %s", settings.subtitles_auto_select)
+    logger.info("Release matching: %s", settings.subtitles_use_release_matching)
+    logger.info("Webhook endpoint: %s", settings.server_webhook_path)
     logger.info("=" * 60)
 
     # Initialize components
@@ -43,15 +74,17 @@ async def lifespan(app: FastAPI):
 
     subtitle_manager = SubtitleManager(settings)
     webhook_handler = WebhookHandler(settings, plex_client, subtitle_manager)
+    discovery = PathDiscovery(plex_client, settings.path_mappings)
 
     # Store in app state
     app.state.plex_client = plex_client
     app.state.subtitle_manager = subtitle_manager
     app.state.webhook_handler = webhook_handler
+    app.state.discovery = discovery
 
     # Run startup validation if configured
     if settings.discovery_enabled and settings.discovery_validate_on_startup:
-        _run_startup_validation(plex_client, settings)
+        _run_startup_validation(discovery, settings)
 
     yield
 
@@ -80,45 +113,55 @@ def create_app() -> FastAPI:
         logger.info("Discovery endpoints enabled at /discover/*")
 
     # Routes
-    @app.post(settings.server_webhook_path)
-    async def handle_webhook(payload: str = Form(...)) -> JSONResponse:
+    @app.post(settings.server_webhook_path, openapi_extra=_WEBHOOK_OPENAPI)
+    async def handle_webhook(request: Request) -> Response:
         """Handle Plex webhook events."""
+        payload = extract_webhook_payload(
+            await request.body(), request.headers.get("content-type", "")
+        )
         if not payload:
             logger.error("No payload in webhook request")
-            return JSONResponse(
-                content=WebhookIgnoredResponse(
-                    status="error", event="missing_payload"
-                ).model_dump(),
-                status_code=400,
+            return Response(
+                content=_MISSING_PAYLOAD_BODY, status_code=400, media_type="application/json"
             )
 
         webhook_handler = app.state.webhook_handler
         response_data, status_code = await webhook_handler.handle_event(payload)
-        return JSONResponse(content=response_data, status_code=status_code)
 
-    @app.get("/health", response_model=HealthResponse)
-    async def health_check() -> HealthResponse:
+        # Most webhook events are ignored; serve their pre-serialized bodies
+        if response_data.get("status") == "ignored":
+            cached_body = _IGNORED_EVENT_BODIES.get(response_data.get("event"))
+            if cached_body is not None:
+                return Response(
+                    content=cached_body, status_code=status_code, media_type="application/json"
+                )
+
+        return ORJSONResponse(content=response_data, status_code=status_code)
+
+    @app.get("/health", responses={200: {"model": HealthResponse}})
+    async def health_check() -> ORJSONResponse:
         """Health check endpoint."""
-        return HealthResponse(status="healthy", version=__version__)
+        return ORJSONResponse(content={"status": "healthy", "version": __version__})
 
-    @app.get("/config", response_model=ConfigResponse)
-    async def get_config() -> ConfigResponse:
+    @app.get("/config", responses={200: {"model": ConfigResponse}})
+    async def get_config() -> ORJSONResponse:
         """Get current configuration (without secrets)."""
-        return ConfigResponse(
-            plex_url=settings.plex_url,
-            languages=settings.languages_list,
-            auto_select=settings.subtitles_auto_select,
-            use_release_matching=settings.subtitles_use_release_matching,
+        return ORJSONResponse(
+            content={
+                "plex_url": settings.plex_url,
+                "languages": settings.languages_list,
+                "auto_select": settings.subtitles_auto_select,
+                "use_release_matching": settings.subtitles_use_release_matching,
+            }
         )
 
     return app
 
 
-def _run_startup_validation(plex_client: PlexClient, settings) -> None:
+def _run_startup_validation(discovery: PathDiscovery, settings) -> None:
     """Run path validation on startup and log results."""
     try:
         logger.info("Running startup path validation...")
-        discovery = PathDiscovery(plex_client, settings.path_mappings)
 
         test_paths = None
         if settings.discovery_test_file:
@@ -131,16 +174,17 @@ def _run_startup_validation(plex_client: PlexClient, settings) -> None:
         else:
             logger.warning("Path validation FAILED: Issues detected with path mappings")
             for suggestion in report.suggestions:
-                logger.warning(f"  - {suggestion}")
+                logger.warning("  - %s", suggestion)
 
         # Log summary
         logger.info(
-            f"Validation summary: {report.summary.get('passed', 0)}/"
-            f"{report.summary.get('total', 0)} tests passed"
+            "Validation summary: %s/%s tests passed",
+            report.summary.get("passed", 0),
+            report.summary.get("total", 0),
         )
 
     except Exception as e:
-        logger.error(f"Startup validation failed: {e}")
+        logger.error("Startup validation failed: %s", e)
 
 
 def main():
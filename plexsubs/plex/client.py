@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from plexsubs.utils.constants import (
+    LIBRARY_SECTIONS_CACHE_TTL_SECONDS,
+    MEDIA_INFO_CACHE_SIZE,
+    MEDIA_INFO_CACHE_TTL_SECONDS,
+)
 from plexsubs.utils.exceptions import PlexAPIError
 from plexsubs.utils.http_client import AuthenticatedHTTPClient
 from plexsubs.utils.logging_config import get_logger
@@ -13,11 +22,13 @@ from plexsubs.utils.path_utils import apply_path_mappings
 from plexsubs.utils.retry import retry_with_backoff
 from plexsubs.utils.xml_utils import (
     MediaPartNavigator,
+    XMLParseError,
     find_imdb_id,
     find_player_element,
     find_session_element,
     find_subtitle_streams,
     find_video_element,
+    iter_xml_elements,
     parse_xml_response,
 )
 
@@ -26,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Subtitle streams directly under a Part element
+_SUBTITLE_STREAM_PATH = "Stream[@streamType='3']"
+
 
 @dataclass
 class MediaInfo:
@@ -50,6 +64,17 @@ class SubtitleStream:
     selected: bool = False
 
 
+def _subtitle_stream_from_attrib(attrib: Mapping[str, str]) -> SubtitleStream:
+    """Build a SubtitleStream from a Stream element's attributes."""
+    return SubtitleStream(
+        id=attrib.get("id", ""),
+        language_code=attrib.get("languageCode", ""),
+        language=attrib.get("language", ""),
+        codec=attrib.get("codec", ""),
+        selected=attrib.get("selected", "0") == "1",
+    )
+
+
 @dataclass
 class LibraryLocation:
     """Library location/path information."""
@@ -113,6 +138,10 @@ class PlexClient(AuthenticatedHTTPClient):
             **kwargs,
         )
         self.path_mappings = path_mappings or {}
+        # rating key -> (expiry, media info); play/resume events come in bursts
+        self._media_info_cache: OrderedDict[str, tuple[float, MediaInfo]] = OrderedDict()
+        self._library_sections_cache: tuple[float, list[LibrarySection]] | None = None
+        self._cache_lock = threading.Lock()
 
     @classmethod
     def from_settings(cls, settings: Settings) -> PlexClient:
@@ -164,19 +193,43 @@ class PlexClient(AuthenticatedHTTPClient):
 
     def _find_subtitle_stream_id(self, part: ET.Element, language_code: str) -> str | None:
         """Find subtitle stream ID by language code within a Part element."""
-        for stream in part.findall("Stream[@streamType='3']"):
+        for stream in part.iterfind(_SUBTITLE_STREAM_PATH):
             if stream.get("languageCode") == language_code:
                 return stream.get("id")
         return None
 
-    @retry_with_backoff(max_retries=3, exceptions=(PlexAPIError,))
+    def _get_metadata_root(self, rating_key: str) -> ET.Element | None:
+        """Fetch and parse /library/metadata/{rating_key}.
+
+        Returns:
+            Root element of the metadata response, or None if it cannot be parsed
+        """
+        response = self.get(f"/library/metadata/{rating_key}")
+        return parse_xml_response(response.content)
+
     def get_media_info(self, rating_key: str) -> MediaInfo | None:
-        """Get media information from Plex."""
+        """Get media information from Plex, reusing a recent lookup."""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._media_info_cache.get(rating_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        info = self._fetch_media_info(rating_key)
+        if info is not None:
+            with self._cache_lock:
+                self._media_info_cache[rating_key] = (now + MEDIA_INFO_CACHE_TTL_SECONDS, info)
+                self._media_info_cache.move_to_end(rating_key)
+                if len(self._media_info_cache) > MEDIA_INFO_CACHE_SIZE:
+                    self._media_info_cache.popitem(last=False)
+        return info
+
+    @retry_with_backoff(max_retries=3, exceptions=(PlexAPIError,))
+    def _fetch_media_info(self, rating_key: str) -> MediaInfo | None:
+        """Fetch media information from Plex."""
         try:
             logger.debug(f"Fetching media info for rating key: {rating_key}")
-            response = self.get(f"/library/metadata/{rating_key}")
-
-            root = parse_xml_response(response.text)
+            root = self._get_metadata_root(rating_key)
             if root is None:
                 raise PlexAPIError("Failed to parse Plex XML response")
 
@@ -222,22 +275,14 @@ class PlexClient(AuthenticatedHTTPClient):
     def get_subtitle_streams(self, rating_key: str) -> list[SubtitleStream]:
         """Get available subtitle streams for media."""
         try:
-            response = self.get(f"/library/metadata/{rating_key}")
-
-            root = parse_xml_response(response.text)
+            root = self._get_metadata_root(rating_key)
             if root is None:
                 return []
 
-            streams = []
-            for stream in find_subtitle_streams(root):
-                subtitle = SubtitleStream(
-                    id=stream.get("id", ""),
-                    language_code=stream.get("languageCode", ""),
-                    language=stream.get("language", ""),
-                    codec=stream.get("codec", ""),
-                    selected=stream.get("selected", "0") == "1",
-                )
-                streams.append(subtitle)
+            streams = [
+                _subtitle_stream_from_attrib(stream.attrib)
+                for stream in find_subtitle_streams(root)
+            ]
 
             logger.debug(f"Found {len(streams)} subtitle streams")
             return streams
@@ -285,10 +330,9 @@ class PlexClient(AuthenticatedHTTPClient):
     ) -> bool:
         """Set the active subtitle stream."""
         try:
-            # Get current streams
-            response = self.get(f"/library/metadata/{rating_key}")
-
-            root = parse_xml_response(response.text)
+            # Get current streams; always fetched fresh, since this runs right
+            # after a metadata refresh that adds the new subtitle stream
+            root = self._get_metadata_root(rating_key)
             if root is None:
                 return False
 
@@ -315,31 +359,35 @@ class PlexClient(AuthenticatedHTTPClient):
             logger.error(f"Failed to set subtitle stream: {e}")
             return False
 
+    def _iter_session_videos(self) -> Iterator[ET.Element]:
+        """Fetch /status/sessions and yield Video elements that have a session ID.
+
+        Elements are cleared as iteration advances, so read each one before moving on.
+        """
+        response = self.get("/status/sessions")
+        try:
+            for video in iter_xml_elements(response.content, "Video"):
+                session = find_session_element(video)
+                if session is not None and session.get("id"):
+                    yield video
+        except XMLParseError as e:
+            logger.error(f"Failed to parse sessions response: {e}")
+
     def get_active_sessions(self) -> list[dict]:
         """Get currently active playback sessions."""
         try:
-            response = self.get("/status/sessions")
-
-            root = parse_xml_response(response.text)
-            if root is None:
-                return []
-
             sessions = []
-            for video in root.findall(".//Video"):
-                session = find_session_element(video)
-                if session is not None:
-                    session_id = session.get("id")
-                    if not session_id:
-                        continue
-                    player = find_player_element(video)
-                    sessions.append(
-                        {
-                            "rating_key": video.get("ratingKey"),
-                            "session_key": session_id,
-                            "title": video.get("title"),
-                            "player": player.get("title") if player is not None else None,
-                        }
-                    )
+            for video in self._iter_session_videos():
+                attrib = video.attrib
+                player = find_player_element(video)
+                sessions.append(
+                    {
+                        "rating_key": attrib.get("ratingKey"),
+                        "session_key": find_session_element(video).get("id"),
+                        "title": attrib.get("title"),
+                        "player": player.get("title") if player is not None else None,
+                    }
+                )
 
             return sessions
 
@@ -358,92 +406,85 @@ class PlexClient(AuthenticatedHTTPClient):
         sets the default for future plays.
         """
         try:
-            # Get active sessions
-            sessions = self.get_active_sessions()
-
-            # Find session for this rating key
-            target_session = None
-            for session in sessions:
-                if session["rating_key"] == rating_key:
-                    target_session = session
-                    break
-
-            if not target_session:
-                logger.debug(f"No active session found for rating key {rating_key}")
-                return False
-
-            # Get session details to find subtitle streams
-            response = self.get("/status/sessions")
-
-            root = parse_xml_response(response.text)
-            if root is None:
-                return False
-
-            # Find the video in sessions
-            for video in root.findall(".//Video"):
-                if video.get("ratingKey") == rating_key:
-                    # Find the Player element
-                    player = find_player_element(video)
-                    if player is None:
-                        logger.warning("No player found in session")
-                        return False
-
-                    machine_identifier = player.get("machineIdentifier")
-                    if not machine_identifier:
-                        logger.warning("No machine identifier found")
-                        return False
-
-                    # Get part and stream info using shared helper
-                    info = self._get_part_stream_info(video, language_code)
-
-                    if not info.part_id:
-                        logger.warning("No part ID found in session")
-                        return False
-
-                    if not info.subtitle_id:
-                        logger.debug(f"No {language_code} subtitle stream found in active session")
-                        return False
-
-                    # Set the subtitle using the shared helper
-                    return self._set_subtitle_by_part_id(
-                        info.part_id, info.subtitle_id, language_code, context="active session"
-                    )
+            # Find the session for this rating key in a single sessions fetch
+            for video in self._iter_session_videos():
+                if video.get("ratingKey") != rating_key:
+                    continue
+
+                # Find the Player element
+                player = find_player_element(video)
+                if player is None:
+                    logger.warning("No player found in session")
+                    return False
+
+                machine_identifier = player.get("machineIdentifier")
+                if not machine_identifier:
+                    logger.warning("No machine identifier found")
+                    return False
+
+                # Get part and stream info using shared helper
+                info = self._get_part_stream_info(video, language_code)
+
+                if not info.part_id:
+                    logger.warning("No part ID found in session")
+                    return False
+
+                if not info.subtitle_id:
+                    logger.debug(f"No {language_code} subtitle stream found in active session")
+                    return False
+
+                # Set the subtitle using the shared helper
+                return self._set_subtitle_by_part_id(
+                    info.part_id, info.subtitle_id, language_code, context="active session"
+                )
 
+            logger.debug(f"No active session found for rating key {rating_key}")
             return False
 
         except PlexAPIError as e:
             logger.error(f"Failed to set active session subtitle: {e}")
             return False
 
-    @retry_with_backoff(max_retries=3, exceptions=(PlexAPIError,))
     def get_library_sections(self) -> list[LibrarySection]:
-        """Get all library sections with their configured paths from Plex."""
+        """Get all library sections with their configured paths, reusing a recent lookup."""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._library_sections_cache
+            if cached is not None and cached[0] > now:
+                return list(cached[1])
+
+        libraries = self._fetch_library_sections()
+        with self._cache_lock:
+            self._library_sections_cache = (now + LIBRARY_SECTIONS_CACHE_TTL_SECONDS, libraries)
+        return list(libraries)
+
+    @retry_with_backoff(max_retries=3, exceptions=(PlexAPIError,))
+    def _fetch_library_sections(self) -> list[LibrarySection]:
+        """Fetch all library sections with their configured paths from Plex."""
         logger.debug("Fetching library sections from Plex")
         response = self.get("/library/sections")
 
-        root = parse_xml_response(response.text)
+        root = parse_xml_response(response.content)
         if root is None:
             raise PlexAPIError("Failed to parse Plex library XML response")
 
         libraries = []
 
-        for directory in root.findall(".//Directory"):
+        for directory in root.iterfind("Directory"):
             # Extract locations for this library
-            locations = []
-            for location in directory.findall("Location"):
-                loc = LibraryLocation(
-                    id=location.get("id", ""),
-                    path=location.get("path", ""),
-                )
-                locations.append(loc)
+            locations = [
+                LibraryLocation(id=location.get("id", ""), path=location.get("path", ""))
+                for location in directory.iterfind("Location")
+            ]
 
+            attrib = directory.attrib
             library = LibrarySection(
-                key=directory.get("key", ""),
-                title=directory.get("title", ""),
-                type=directory.get("type", ""),
-                agent=directory.get("agent", ""),
-                scanner=directory.get("scanner", ""),
-                language=directory.get("language", ""),
+                key=attrib.get("key", ""),
+                title=attrib.get("title", ""),
+                type=attrib.get("type", ""),
+                agent=attrib.get("agent", ""),
+                scanner=attrib.get("scanner", ""),
+                language=attrib.get("language", ""),
                 locations=locations,
             )
             libraries.append(library)
@@ -1,9 +1,12 @@
 """Webhook handler logic."""
 
 import asyncio
-import json
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable
+import re
+from collections.abc import Awaitable
+from typing import Callable, Optional, Union
+from urllib.parse import parse_qs
+
+import orjson
 
 from plexsubs.config.settings import Settings
 from plexsubs.core.subtitle_manager import SubtitleManager
@@ -19,6 +22,45 @@ from plexsubs.utils.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_PAYLOAD_DISPOSITION_RE = re.compile(rb'\bname="payload"')
+# Plex writes "event" first in its payload, so the event type can be read
+# from the head of the document without decoding the rest
+_EVENT_RE = re.compile(rb'"event"\s*:\s*"([^"\\]*)"')
+_EVENT_SCAN_BYTES = 256
+
+
+def extract_webhook_payload(body: bytes, content_type: str) -> Optional[bytes]:
+    """Extract the JSON payload from a raw Plex webhook request body.
+
+    Plex posts multipart/form-data with a ``payload`` field (plus a thumbnail
+    for some events). Only that field is located in the raw bytes, so the
+    thumbnail is never parsed or spooled. URL-encoded forms and bare JSON
+    bodies are accepted as well.
+
+    Args:
+        body: Raw request body
+        content_type: Value of the Content-Type header
+
+    Returns:
+        Payload bytes, or None if the body has no payload
+    """
+    if content_type.startswith("multipart/form-data"):
+        match = _BOUNDARY_RE.search(content_type)
+        if not match:
+            return None
+        for part in body.split(b"--" + match.group(1).encode()):
+            headers, separator, content = part.partition(b"\r\n\r\n")
+            if separator and _PAYLOAD_DISPOSITION_RE.search(headers):
+                return content.removesuffix(b"\r\n") or None
+        return None
+
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        values = parse_qs(body).get(b"payload")
+        return values[0] if values else None
+
+    return body or None
+
 
 class WebhookHandler:
     """Handle Plex webhook events."""
@@ -32,7 +74,10 @@ class WebhookHandler:
         self.settings = settings
         self.plex = plex_client
         self.subtitle_manager = subtitle_manager
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Event type -> handler; every other event is acknowledged and ignored
+        self._handlers: dict[str, Callable[[dict], Awaitable[tuple]]] = {
+            event: self._handle_playback_event for event in PROCESSABLE_EVENTS
+        }
 
     @retry_with_backoff(
         max_retries=MAX_SESSION_RETRIES,
@@ -54,7 +99,7 @@ class WebhookHandler:
         Raises:
             Exception: If subtitle setting failed (triggers retry)
         """
-        success = await self._run_in_executor(
+        success = await asyncio.to_thread(
             self.plex.set_active_session_subtitle,
             rating_key,
             language_code,
@@ -84,41 +129,49 @@ class WebhookHandler:
             # All retries exhausted, return False
             return False
 
-    async def _run_in_executor(self, func: Callable, *args: Any) -> Any:
-        """Run a synchronous function in the thread pool.
-
-        Args:
-            func: Function to run
-            *args: Arguments to pass to the function
-
-        Returns:
-            Result from the function
-        """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, func, *args)
-
-    async def handle_event(self, payload_str: str) -> tuple:
+    async def handle_event(self, payload_str: Union[str, bytes]) -> tuple:
         """Handle a Plex webhook event.
 
         Returns:
             Tuple of (response_dict, status_code)
         """
+        if isinstance(payload_str, str):
+            payload_str = payload_str.encode()
+
+        # Skip decoding entirely for events we do not process
+        match = _EVENT_RE.search(payload_str, 0, _EVENT_SCAN_BYTES)
+        if match is not None:
+            event = match.group(1).decode("utf-8", "replace")
+            if event not in self._handlers:
+                logger.info(f"Received webhook event: {event}")
+                logger.debug(f"Ignoring event: {event}")
+                return {"status": "ignored", "event": event}, 200
+
         try:
-            payload = json.loads(payload_str)
-        except json.JSONDecodeError as e:
+            payload = orjson.loads(payload_str)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON payload: {e}")
             return {"status": "error", "message": "Invalid JSON"}, 400
 
         event = payload.get("event")
         logger.info(f"Received webhook event: {event}")
 
-        # Only process play and resume events
-        if event not in PROCESSABLE_EVENTS:
+        handler = self._handlers.get(event)
+        if handler is None:
             logger.debug(f"Ignoring event: {event}")
             return {"status": "ignored", "event": event}, 200
 
-        # Get metadata
-        metadata = payload.get("Metadata", {})
+        return await handler(payload.get("Metadata", {}))
+
+    async def _handle_playback_event(self, metadata: dict) -> tuple:
+        """Download and select subtitles for media that started or resumed playing.
+
+        Args:
+            metadata: The payload's Metadata object
+
+        Returns:
+            Tuple of (response_dict, status_code)
+        """
         rating_key = metadata.get("ratingKey")
 
         if not rating_key:
@@ -129,7 +182,7 @@ class WebhookHandler:
 
         # Get media info from Plex (run in thread pool to avoid blocking)
         try:
-            media_info = await self._run_in_executor(self.plex.get_media_info, rating_key)
+            media_info = await asyncio.to_thread(self.plex.get_media_info, rating_key)
         except PlexSubtitleError as e:
             logger.error(f"Failed to get media info: {e}")
             return {"status": "error", "message": str(e)}, 500
@@ -144,7 +197,7 @@ class WebhookHandler:
 
         # Try to download subtitles (run in thread pool)
         try:
-            result = await self._run_in_executor(
+            result = await asyncio.to_thread(
                 self.subtitle_manager.download_subtitles,
                 media_info.file_path,
                 media_info.title,
@@ -155,7 +208,7 @@ class WebhookHandler:
 
             if result["success"]:
                 # Refresh Plex metadata (run in thread pool)
-                await self._run_in_executor(self.plex.refresh_metadata, rating_key)
+                await asyncio.to_thread(self.plex.refresh_metadata, rating_key)
 
                 # Auto-select subtitle if enabled
                 if self.settings.subtitles_auto_select:
@@ -170,7 +223,7 @@ class WebhookHandler:
                             "Could not set subtitle on active session, "
                             "setting default for future plays..."
                         )
-                        default_success = await self._run_in_executor(
+                        default_success = await asyncio.to_thread(
                             self.plex.set_subtitle_stream,
                             rating_key,
                             result["language_code"],
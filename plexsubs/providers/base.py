@@ -41,7 +41,7 @@ class BaseProvider(ABC):
         year: Optional[int] = None,
         imdb_id: Optional[str] = None,
         language: str = "nl",
-        release_groups: Optional[list[str]] = None,
+        release_groups: Optional[tuple[str, ...]] = None,
         filename: Optional[str] = None,
     ) -> tuple[list[SubtitleResult], Optional[str]]:
         """Search for subtitles.
@@ -51,7 +51,7 @@ class BaseProvider(ABC):
             year: Release year
             imdb_id: IMDB identifier
             language: Language code (e.g., 'nl', 'en')
-            release_groups: List of release group names for matching
+            release_groups: Release group names for matching
             filename: Original media filename
 
         Returns:
@@ -72,6 +72,9 @@ class BaseProvider(ABC):
 
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            DownloadError: On transient faults; the caller retries these
         """
         pass
 
@@ -12,15 +12,18 @@ from plexsubs.utils.constants import (
     DEFAULT_REQUEST_TIMEOUT,
     DOWNLOAD_TIMEOUT,
     TOKEN_EXPIRY_SECONDS,
+    TOKEN_REFRESH_MARGIN_SECONDS,
 )
-from plexsubs.utils.exceptions import OpenSubtitlesError
+from plexsubs.utils.exceptions import DownloadError, OpenSubtitlesError
 from plexsubs.utils.http_client import AuthenticatedHTTPClient
-from plexsubs.utils.language_codes import get_allowed_languages
+from plexsubs.utils.language_codes import get_allowed_language_set
 from plexsubs.utils.logging_config import get_logger
-from plexsubs.utils.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Read size when streaming a subtitle file to disk
+_DOWNLOAD_CHUNK_SIZE = 65536
+
 
 class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
     """OpenSubtitles.com API provider.
@@ -62,20 +65,25 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
         self.api_key = api_key
         self._token_expiry: float = 0
         self._token_lock = threading.Lock()
-
-    def _get_headers(self) -> dict[str, str]:
-        """Build request headers with API key and authentication."""
-        headers = {
+        # Finished login attempts, and the error from the latest one if it failed;
+        # callers queued behind a failed login fail with it instead of retrying
+        self._auth_attempts = 0
+        self._auth_error: Optional[str] = None
+        # Renews the token shortly before it expires, off the request path
+        self._refresh_timer: Optional[threading.Timer] = None
+
+        # Headers sent with every request, authenticated or not
+        self._static_headers: dict[str, str] = {
             "Content-Type": "application/json",
             "User-Agent": "PlexSubtitleWebhook/2.0",
         }
-        if self.api_key:
-            headers["Api-Key"] = self.api_key
-
-        # Add authentication header from parent class
-        auth_headers = super()._get_headers()
-        headers.update(auth_headers)
+        if api_key:
+            self._static_headers["Api-Key"] = api_key
 
+    def _get_headers(self) -> dict[str, str]:
+        """Build request headers with API key and authentication."""
+        headers = super()._get_headers()
+        headers.update(self._static_headers)
         return headers
 
     def _authenticate(self) -> str:
@@ -85,42 +93,90 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
             return self.token
 
         # Slow path: acquire lock and authenticate
+        attempts_seen = self._auth_attempts
         with self._token_lock:
             # Double-check after acquiring lock
             if self.token and time.time() < self._token_expiry:
                 return self.token
 
-            logger.info("Authenticating with OpenSubtitles API")
+            # A login ran and failed while we waited; don't stampede the API
+            if self._auth_attempts != attempts_seen and self._auth_error is not None:
+                raise OpenSubtitlesError(f"Authentication failed: {self._auth_error}")
 
             try:
-                # Use parent class POST method but without authentication
-                url = f"{self.base_url}/login"
-                payload = {"username": self.username, "password": self.password}
-
-                # Make unauthenticated request for login
-                headers = {
-                    "Content-Type": "application/json",
-                    "User-Agent": "PlexSubtitleWebhook/2.0",
-                }
-                if self.api_key:
-                    headers["Api-Key"] = self.api_key
-
-                response = requests.post(
-                    url, json=payload, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                self.token = data.get("token")
-                # Token typically valid for 24 hours
-                self._token_expiry = time.time() + TOKEN_EXPIRY_SECONDS
-
-                logger.info("Successfully authenticated with OpenSubtitles")
-                return self.token
-
+                token = self._login()
             except requests.exceptions.RequestException as e:
+                self._auth_error = str(e)
+                self._auth_attempts += 1
                 raise OpenSubtitlesError(f"Authentication failed: {e}")
 
+            self._auth_error = None
+            self._auth_attempts += 1
+            return token
+
+    def _login(self) -> str:
+        """Log in and store the new token; the caller must hold _token_lock."""
+        logger.info("Authenticating with OpenSubtitles API")
+
+        # Use parent class POST method but without authentication
+        url = f"{self.base_url}/login"
+        payload = {"username": self.username, "password": self.password}
+
+        # Make unauthenticated request for login
+        response = self.session.post(
+            url,
+            json=payload,
+            headers=self._static_headers,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        self.token = data.get("token")
+        # Token typically valid for 24 hours
+        self._token_expiry = time.time() + TOKEN_EXPIRY_SECONDS
+
+        self._schedule_refresh()
+        logger.info("Successfully authenticated with OpenSubtitles")
+        return self.token
+
+    def _schedule_refresh(self) -> None:
+        """Arm a timer that renews the token shortly before it expires."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = max(0.0, self._token_expiry - time.time() - TOKEN_REFRESH_MARGIN_SECONDS)
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self) -> None:
+        """Log in again before the current token expires.
+
+        The current token stays in use until the new one is stored, so
+        requests made during the refresh are not held up by it.
+        """
+        with self._token_lock:
+            try:
+                self._login()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # The current token remains valid; once it expires the next
+                # request logs in on demand
+                logger.warning(f"Background token refresh failed: {e}")
+
+    def clear_token(self) -> None:
+        """Clear the authentication token and stop any scheduled refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        super().clear_token()
+
+    def close(self) -> None:
+        """Stop any scheduled token refresh and close the HTTP session."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        super().close()
+
     def _make_request(
         self,
         method: str,
@@ -146,8 +202,9 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
         Raises:
             OpenSubtitlesError: If the request fails
         """
-        # Ensure we have a valid token
-        self._authenticate()
+        # Ensure we have a valid token; checked inline since this runs per request
+        if not self.token or time.time() >= self._token_expiry:
+            self._authenticate()
 
         try:
             response = super()._make_request(
@@ -184,16 +241,13 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
         year: Optional[int] = None,
         imdb_id: Optional[str] = None,
         language: str = "nl",
-        release_groups: Optional[list[str]] = None,
+        release_groups: Optional[tuple[str, ...]] = None,
         filename: Optional[str] = None,
     ) -> tuple[list[SubtitleResult], Optional[str]]:
         """Search for subtitles on OpenSubtitles."""
         if not self.enabled:
             return [], None
 
-        # Ensure authenticated
-        self._authenticate()
-
         params = {"languages": language}
 
         if imdb_id:
@@ -215,32 +269,13 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
                 return [], self.token
 
             # Filter by language
-            allowed_langs = get_allowed_languages(language)
-
-            results = []
-            for sub in subtitles:
-                attrs = sub.get("attributes", {})
-                sub_lang = attrs.get("language", "").lower()
-
-                if sub_lang not in allowed_langs:
-                    continue
+            allowed_langs = get_allowed_language_set(language)
 
-                files = attrs.get("files", [])
-                if not files:
-                    continue
-
-                file_info = files[0]
-
-                result = SubtitleResult(
-                    id=str(file_info.get("file_id")),
-                    language=language,
-                    release=attrs.get("release", ""),
-                    filename=file_info.get("file_name", ""),
-                    download_params={"file_id": file_info.get("file_id")},
-                    provider=self.name,
-                    download_count=attrs.get("download_count", 0),
-                )
-                results.append(result)
+            results = [
+                self._to_subtitle_result(attrs, language)
+                for attrs in (sub.get("attributes", {}) for sub in subtitles)
+                if attrs.get("files") and attrs.get("language", "").lower() in allowed_langs
+            ]
 
             logger.info(f"Filtered to {len(results)} subtitles in language '{language}'")
             return results, self.token
@@ -249,16 +284,28 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
             logger.error(f"Search failed: {e}")
             raise OpenSubtitlesError(f"Search failed: {e}")
 
-    def _download_with_retry(
-        self,
-        subtitle: SubtitleResult,
-        output_path: str,
-        token: Optional[str],
+    def _to_subtitle_result(self, attrs: dict, language: str) -> SubtitleResult:
+        """Build a SubtitleResult from a search hit's attributes, using its first file."""
+        file_info = attrs["files"][0]
+        return SubtitleResult(
+            id=str(file_info.get("file_id")),
+            language=language,
+            release=attrs.get("release", ""),
+            filename=file_info.get("file_name", ""),
+            download_params={"file_id": file_info.get("file_id")},
+            provider=self.name,
+            download_count=attrs.get("download_count", 0),
+        )
+
+    def download(
+        self, subtitle: SubtitleResult, output_path: str, token: Optional[str] = None
     ) -> bool:
-        """Internal download method to be wrapped by retry decorator."""
-        if not token:
-            token = self._authenticate()
+        """Download subtitle from OpenSubtitles.
 
+        Raises:
+            DownloadError: If fetching the file failed in a way worth retrying
+            OpenSubtitlesError: If the API refused the download request
+        """
         payload = subtitle.download_params or {"file_id": subtitle.id}
 
         # Get download link
@@ -269,46 +316,25 @@ class OpenSubtitlesProvider(BaseProvider, AuthenticatedHTTPClient):
             logger.error("No download link in response")
             return False
 
-        # Download the file
+        # Download the file, streaming it to disk over the pooled session
         logger.info(f"Downloading subtitle from: {download_link[:50]}...")
-        sub_response = requests.get(download_link, timeout=DOWNLOAD_TIMEOUT)
-        sub_response.raise_for_status()
-
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-
-        # Save file
-        with open(output_path, "wb") as f:
-            f.write(sub_response.content)
+        try:
+            with self.session.get(
+                download_link, timeout=DOWNLOAD_TIMEOUT, stream=True
+            ) as sub_response:
+                sub_response.raise_for_status()
+
+                # Ensure output directory exists
+                output_dir = os.path.dirname(output_path)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+
+                # Save file
+                with open(output_path, "wb") as f:
+                    for chunk in sub_response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+        except requests.exceptions.RequestException as e:
+            raise DownloadError(f"Subtitle download failed: {e}") from e
 
         logger.info(f"Downloaded subtitle to: {output_path}")
         return True
-
-    def download(
-        self, subtitle: SubtitleResult, output_path: str, token: Optional[str] = None
-    ) -> bool:
-        """Download subtitle from OpenSubtitles with retry on server errors."""
-
-        def on_retry(attempt: int, delay: float, exception: Exception) -> None:
-            """Log retry attempts."""
-            if isinstance(exception, requests.exceptions.HTTPError):
-                status_code = exception.response.status_code if exception.response else "unknown"
-                logger.warning(
-                    f"Server error {status_code} on attempt {attempt + 1}, retrying in {delay}s..."
-                )
-            else:
-                logger.warning(f"Download failed on attempt {attempt + 1}, retrying in {delay}s...")
-
-        try:
-            # Use retry decorator with server error exceptions
-            return retry_with_backoff(
-                max_retries=3,
-                base_delay=2.0,
-                exceptions=(requests.exceptions.HTTPError, requests.exceptions.RequestException),
-                on_retry=on_retry,
-            )(self._download_with_retry)(subtitle, output_path, token)
-        except Exception as e:
-            logger.error(f"Download failed after all retries: {e}")
-            return False
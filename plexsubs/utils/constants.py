@@ -9,13 +9,40 @@ COMMON_MEDIA_MOUNTS: list[str] = ["/mnt", "/media", "/data", "/volume", "/srv"]
 # Subtitle file extensions
 SUBTITLE_EXTENSIONS: list[str] = [".srt", ".ass", ".ssa", ".vtt"]
 
+# Amount of a subtitle file read for language detection (64 KiB is plenty
+# of dialogue for langdetect; the rest of the file is never needed)
+LANGUAGE_DETECTION_SAMPLE_SIZE: int = 65536
+
 # Plex webhook events to process
-PROCESSABLE_EVENTS: set[str] = {"media.play", "media.resume"}
+PROCESSABLE_EVENTS: frozenset[str] = frozenset({"media.play", "media.resume"})
+
+# All event types Plex sends to webhooks
+PLEX_WEBHOOK_EVENTS: tuple[str, ...] = (
+    "media.play",
+    "media.pause",
+    "media.resume",
+    "media.stop",
+    "media.scrobble",
+    "media.rate",
+    "library.on.deck",
+    "library.new",
+    "admin.database.backup",
+    "admin.database.corrupted",
+    "device.new",
+    "playback.started",
+)
 
 # HTTP timeouts
 DEFAULT_REQUEST_TIMEOUT: int = 10
 DOWNLOAD_TIMEOUT: int = 30
 
+# Connection pooling: webhook work runs on the default thread pool (up to 32
+# workers), so keep that many connections alive per host
+HTTP_POOL_MAXSIZE: int = 32
+# Transport-level retries for idempotent GETs hitting gateway errors
+HTTP_TRANSPORT_RETRIES: int = 2
+HTTP_TRANSPORT_BACKOFF_FACTOR: float = 0.5
+
 # Retry configuration
 DEFAULT_MAX_RETRIES: int = 3
 DEFAULT_RETRY_DELAY_SECONDS: int = 5
@@ -24,6 +51,21 @@ DEFAULT_BASE_RETRY_DELAY: float = 1.0
 # Token expiry
 TOKEN_EXPIRY_HOURS: int = 23
 TOKEN_EXPIRY_SECONDS: int = TOKEN_EXPIRY_HOURS * 3600  # 82800
+# Renew tokens in the background this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS: int = 300
+
+# Negative cache for subtitle searches that found nothing (play/resume
+# events for the same media arrive in bursts)
+SEARCH_MISS_TTL_SECONDS: int = 900
+SEARCH_MISS_CACHE_SIZE: int = 4096
+
+# Media directory listings kept between webhooks, invalidated by mtime
+DIR_SNAPSHOT_CACHE_SIZE: int = 512
+
+# Plex responses reused between webhook events
+MEDIA_INFO_CACHE_TTL_SECONDS: int = 30
+MEDIA_INFO_CACHE_SIZE: int = 512
+LIBRARY_SECTIONS_CACHE_TTL_SECONDS: int = 300
 
 # Webhook session retry delays
 BASE_RETRY_WAIT_SECONDS: int = 3
@@ -1,8 +1,13 @@
 """Environment and system utilities."""
 
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def is_running_in_docker() -> bool:
-    """Check if running inside a Docker container."""
+    """Check if running inside a Docker container.
+
+    The result is cached; the container status cannot change at runtime.
+    """
     return os.path.exists("/.dockerenv")
@@ -1,27 +1,38 @@
-"""Custom exceptions for Plex Subtitle Webhook."""
+"""Custom exceptions for Plex Subtitle Webhook.
+
+Each exception class carries the HTTP status code and machine-readable
+error code used when it is converted into an API error response.
+Subclasses inherit these unless they override them.
+"""
 
 
 class PlexSubtitleError(Exception):
     """Base exception for all errors."""
 
-    pass
+    status_code: int = 500
+    error_code: str = "PLEXSUBS_ERROR"
 
 
 class ConfigurationError(PlexSubtitleError):
     """Configuration validation or loading error."""
 
-    pass
+    status_code = 500
+    error_code = "CONFIGURATION_ERROR"
 
 
 class PlexAPIError(PlexSubtitleError):
     """Plex API communication error."""
 
-    pass
+    status_code = 503
+    error_code = "PLEX_API_ERROR"
 
 
 class ProviderError(PlexSubtitleError):
     """Base exception for subtitle provider errors."""
 
+    status_code = 503
+    error_code = "PROVIDER_ERROR"
+
     def __init__(self, message: str, provider: str = None):
         super().__init__(message)
         self.provider = provider
@@ -30,6 +41,8 @@ class ProviderError(PlexSubtitleError):
 class OpenSubtitlesError(ProviderError):
     """OpenSubtitles API error."""
 
+    error_code = "OPENSUBTITLES_ERROR"
+
     def __init__(self, message: str):
         super().__init__(message, provider="opensubtitles")
 
@@ -37,22 +50,26 @@ class OpenSubtitlesError(ProviderError):
 class SubtitleNotFoundError(PlexSubtitleError):
     """Subtitle not found for media."""
 
-    pass
+    status_code = 404
+    error_code = "SUBTITLE_NOT_FOUND"
 
 
 class DownloadError(PlexSubtitleError):
     """Subtitle download failed."""
 
-    pass
+    status_code = 500
+    error_code = "DOWNLOAD_ERROR"
 
 
 class LanguageDetectionError(PlexSubtitleError):
     """Language detection failed."""
 
-    pass
+    status_code = 500
+    error_code = "LANGUAGE_DETECTION_ERROR"
 
 
 class ReleaseMatchingError(PlexSubtitleError):
     """Release group matching failed."""
 
-    pass
+    status_code = 500
+    error_code = "RELEASE_MATCHING_ERROR"
@@ -9,8 +9,15 @@ from typing import Optional
 
 import requests
 import urllib3
-
-from plexsubs.utils.constants import DEFAULT_REQUEST_TIMEOUT
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from plexsubs.utils.constants import (
+    DEFAULT_REQUEST_TIMEOUT,
+    HTTP_POOL_MAXSIZE,
+    HTTP_TRANSPORT_BACKOFF_FACTOR,
+    HTTP_TRANSPORT_RETRIES,
+)
 from plexsubs.utils.exceptions import PlexAPIError
 from plexsubs.utils.logging_config import get_logger
 
@@ -51,6 +58,21 @@ class BaseHTTPClient(ABC):
         self.session = requests.Session()
         self.session.verify = verify_ssl
 
+        # Only GETs are retried here: POSTs such as an OpenSubtitles download
+        # request are not idempotent. Exhausted retries hand back the last
+        # response, so raise_for_status and the callers' own retries still apply.
+        retry = Retry(
+            total=HTTP_TRANSPORT_RETRIES,
+            backoff_factor=HTTP_TRANSPORT_BACKOFF_FACTOR,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _get_headers(self) -> dict[str, str]:
         """Build request headers.
 
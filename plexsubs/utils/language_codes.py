@@ -5,6 +5,8 @@ Includes minimal fallback for English language names since iso639 doesn't
 accept them directly (e.g., 'dutch' -> 'nl').
 """
 
+from functools import lru_cache
+
 from iso639 import Lang
 from iso639.exceptions import InvalidLanguageValue
 
@@ -80,6 +82,22 @@ def get_allowed_languages(language: str) -> list[str]:
         return [language.lower()]
 
 
+@lru_cache(maxsize=256)
+def get_allowed_language_set(language: str) -> frozenset[str]:
+    """Get the allowed language codes for a language as a cached, lowercase set.
+
+    Same codes as get_allowed_languages, for repeated membership checks.
+
+    Args:
+        language: Language code or name (e.g., 'nl', 'nld', 'dutch')
+
+    Returns:
+        Frozenset of all valid lowercase codes for that language
+    """
+    return frozenset(code.lower() for code in get_allowed_languages(language))
+
+
+@lru_cache(maxsize=256)
 def to_plex_language_code(language: str) -> str:
     """Convert language code to Plex format (ISO 639-2/T 3-letter code).
 
@@ -98,6 +116,7 @@ def to_plex_language_code(language: str) -> str:
         return language.lower()
 
 
+@lru_cache(maxsize=256)
 def to_iso639_1(language: str) -> str | None:
     """Convert any language code to ISO 639-1 (2-letter code).
 
@@ -134,8 +153,7 @@ def verify_language_match(detected: str, expected: str) -> bool:
         return True
 
     # Check if detected is in allowed codes for expected
-    allowed = get_allowed_languages(expected)
-    return detected in [a.lower() for a in allowed]
+    return detected in get_allowed_language_set(expected)
 
 
 def normalize_language_code(code: str) -> str:
@@ -166,6 +184,7 @@ def get_supported_languages() -> list[str]:
     return sorted([lang.pt1 for lang in iter_langs() if lang.pt1])
 
 
+@lru_cache(maxsize=256)
 def is_valid_language(code: str) -> bool:
     """Check if a language code is valid.
 
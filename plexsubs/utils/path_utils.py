@@ -1,7 +1,7 @@
 """Path utilities for mapping and manipulation."""
 
 import os
-from pathlib import Path
+import stat
 
 from plexsubs.utils.constants import DEFAULT_PATH_MAPPINGS
 
@@ -62,22 +62,24 @@ def check_file_permissions(file_path: str) -> dict[str, bool]:
         "is_directory": False,
     }
 
+    # Match pathlib semantics: an empty path is the current directory
+    file_path = file_path or "."
+
+    # One stat call answers exists/is_file/is_directory
     try:
-        path_obj = Path(file_path)
-        result["exists"] = path_obj.exists()
-
-        if result["exists"]:
-            result["is_file"] = path_obj.is_file()
-            result["is_directory"] = path_obj.is_dir()
-
-            if result["is_file"]:
-                result["readable"] = os.access(file_path, os.R_OK)
-                result["writable"] = os.access(path_obj.parent, os.W_OK)
-            elif result["is_directory"]:
-                result["readable"] = os.access(file_path, os.R_OK)
-                result["writable"] = os.access(file_path, os.W_OK)
-
-    except OSError:
-        pass
+        st = os.stat(file_path)
+    except (OSError, ValueError):
+        return result
+
+    result["exists"] = True
+    result["is_file"] = stat.S_ISREG(st.st_mode)
+    result["is_directory"] = stat.S_ISDIR(st.st_mode)
+
+    if result["is_file"]:
+        result["readable"] = os.access(file_path, os.R_OK)
+        result["writable"] = os.access(os.path.dirname(file_path) or ".", os.W_OK)
+    elif result["is_directory"]:
+        result["readable"] = os.access(file_path, os.R_OK)
+        result["writable"] = os.access(file_path, os.W_OK)
 
     return result
@@ -4,31 +4,108 @@ Provides utilities for parsing and navigating Plex XML responses,
 including a fluent navigator API for clean traversal of Video → Media → Part hierarchy.
 """
 
-import xml.etree.ElementTree as ET
+import io
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 from plexsubs.utils.logging_config import get_logger
 
+# lxml is optional: its C parser is much faster on large session and library
+# responses, and its elements expose the same ElementTree API
+try:
+    from lxml import etree as ET  # noqa: N812
+
+    _PARSER = ET.XMLParser(resolve_entities=False, no_network=True)
+    _ITERPARSE_OPTIONS = {"resolve_entities": False, "no_network": True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _PARSER = None
+    _ITERPARSE_OPTIONS = {}
+
+# Raised for malformed XML by whichever backend is in use
+XMLParseError = ET.ParseError
+
+# C0 control characters other than tab, newline and carriage return
+_INVALID_XML_CHARS_RE = re.compile(rb"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 logger = get_logger(__name__)
 
 
-def parse_xml_response(response_text: str) -> Optional[ET.Element]:
+def parse_xml_response(response_text: Union[str, bytes]) -> Optional[ET.Element]:
     """Parse XML response text into an ElementTree root.
 
+    The raw body is parsed first; control characters that XML 1.0 forbids
+    (which Plex can emit inside titles) are only stripped if that fails.
+
     Args:
-        response_text: XML response text from Plex API
+        response_text: XML response body from Plex API, as text or raw bytes
 
     Returns:
         Root Element or None if parsing fails
     """
+    if isinstance(response_text, str):
+        # lxml rejects str input that carries an encoding declaration
+        response_text = response_text.encode()
     try:
-        return ET.fromstring(response_text)
-    except ET.ParseError as e:
+        return ET.fromstring(response_text, _PARSER)
+    except XMLParseError as e:
+        cleaned = _INVALID_XML_CHARS_RE.sub(b"", response_text)
+        if cleaned != response_text:
+            try:
+                return ET.fromstring(cleaned, _PARSER)
+            except XMLParseError:
+                pass
         logger.error(f"Failed to parse XML response: {e}")
         return None
 
 
+def iter_xml_elements(content: bytes, tag: str) -> Iterator[ET.Element]:
+    """Incrementally parse XML, yielding each complete element with the given tag.
+
+    Each element is cleared once the caller moves on, so only one subtree is
+    kept in memory at a time. Use the element's data before advancing.
+
+    Like parse_xml_response, control characters that XML 1.0 forbids are
+    only stripped if the raw body fails to parse; elements already yielded
+    before the failure are not yielded again.
+
+    Args:
+        content: Raw XML response body
+        tag: Element tag to yield (e.g. "Video")
+
+    Yields:
+        Fully parsed elements with the requested tag
+
+    Raises:
+        XMLParseError: If the XML is malformed even without control characters
+    """
+    yielded = 0
+    try:
+        for elem in _iterparse_elements(content, tag):
+            yield elem
+            yielded += 1
+    except XMLParseError:
+        cleaned = _INVALID_XML_CHARS_RE.sub(b"", content)
+        if cleaned == content:
+            raise
+        # Stripping characters cannot change the element structure, so the
+        # first `yielded` matches are the ones the caller has already seen
+        for index, elem in enumerate(_iterparse_elements(cleaned, tag)):
+            if index >= yielded:
+                yield elem
+
+
+def _iterparse_elements(content: bytes, tag: str) -> Iterator[ET.Element]:
+    """Yield elements with the given tag, clearing each once the caller resumes."""
+    for _, elem in ET.iterparse(io.BytesIO(content), **_ITERPARSE_OPTIONS):
+        if elem.tag == tag:
+            yield elem
+            elem.clear()
+
+
 def find_video_element(root: ET.Element) -> Optional[ET.Element]:
     """Find the Video element in a Plex metadata response.
 
@@ -86,7 +163,7 @@ def find_imdb_id(root: ET.Element) -> Optional[str]:
     Returns:
         IMDB ID without prefix or None if not found
     """
-    for guid in root.findall(".//Guid"):
+    for guid in root.iterfind(".//Guid"):
         guid_id = guid.get("id", "")
         if guid_id.startswith("imdb://"):
             return guid_id.replace("imdb://", "")
@@ -221,9 +298,11 @@ class MediaPartNavigator:
             MediaPartData with all extracted information
         """
         self._initialize()
+        # Elements without children are falsy, so compare against None
+        attrib = self._part.attrib if self._part is not None else {}
         return MediaPartData(
-            file_path=self._part.get("file") if self._part else None,
-            part_id=self._part.get("id") if self._part else None,
+            file_path=attrib.get("file"),
+            part_id=attrib.get("id"),
             media_element=self._media,
             part_element=self._part,
         )
@@ -0,0 +1,160 @@
+"""Tests for API error handling."""
+
+import asyncio
+import inspect
+import json
+
+import pytest
+
+from plexsubs.api.errors import (
+    _get_status_code_from_message,
+    api_error_handler,
+    create_error_response,
+    handle_exception,
+)
+from plexsubs.utils.exceptions import (
+    ConfigurationError,
+    DownloadError,
+    LanguageDetectionError,
+    OpenSubtitlesError,
+    PlexAPIError,
+    PlexSubtitleError,
+    ProviderError,
+    ReleaseMatchingError,
+    SubtitleNotFoundError,
+)
+
+
+class TestGetStatusCodeFromMessage:
+    """Tests for _get_status_code_from_message function."""
+
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("Subtitle not found", 404),
+            ("No suitable subtitle available", 404),
+            ("Unauthorized access", 401),
+            ("Authentication failed", 401),
+            ("Invalid language code", 400),
+            ("Bad Request from server", 400),
+            ("Connection TIMEOUT", 504),
+            ("Something went wrong", 500),
+            ("", 500),
+        ],
+    )
+    def test_keyword_status_codes(self, message, expected):
+        """Test each keyword maps to its status code."""
+        assert _get_status_code_from_message(message) == expected
+
+    def test_case_insensitive(self):
+        """Test keyword matching ignores case."""
+        assert _get_status_code_from_message("NOT FOUND") == 404
+        assert _get_status_code_from_message("Not Found") == 404
+
+    def test_priority_over_position(self):
+        """Test higher-priority keywords win regardless of position."""
+        assert _get_status_code_from_message("Invalid request: file not found") == 404
+        assert _get_status_code_from_message("Timeout during authentication") == 401
+        assert _get_status_code_from_message("timeout: invalid response") == 400
+
+
+class TestApiErrorHandler:
+    """Tests for api_error_handler decorator."""
+
+    def test_sync_function_returns_value(self):
+        """Test sync function result passes through."""
+
+        @api_error_handler("testing")
+        def func(x):
+            return x * 2
+
+        assert func(2) == 4
+
+    def test_sync_function_error_returns_response(self):
+        """Test sync function exceptions become error responses."""
+
+        @api_error_handler("testing")
+        def func():
+            raise PlexAPIError("Plex unreachable")
+
+        response = func()
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_async_function_error_returns_response(self):
+        """Test async function exceptions become error responses."""
+
+        @api_error_handler("testing")
+        async def func():
+            raise SubtitleNotFoundError("missing")
+
+        response = await func()
+        assert response.status_code == 404
+
+    def test_preserves_metadata(self):
+        """Test wrapper keeps name, docstring and async-ness."""
+
+        @api_error_handler("testing")
+        async def my_endpoint(x: int):
+            """Endpoint docstring."""
+            return x
+
+        assert my_endpoint.__name__ == "my_endpoint"
+        assert my_endpoint.__doc__ == "Endpoint docstring."
+        assert asyncio.iscoroutinefunction(my_endpoint)
+        assert list(inspect.signature(my_endpoint).parameters) == ["x"]
+
+
+class TestHandleException:
+    """Tests for handle_exception function."""
+
+    @pytest.mark.parametrize(
+        "exc,status_code,error_code",
+        [
+            (ConfigurationError("bad config"), 500, "CONFIGURATION_ERROR"),
+            (PlexAPIError("down"), 503, "PLEX_API_ERROR"),
+            (ProviderError("down"), 503, "PROVIDER_ERROR"),
+            (OpenSubtitlesError("down"), 503, "OPENSUBTITLES_ERROR"),
+            (SubtitleNotFoundError("missing"), 404, "SUBTITLE_NOT_FOUND"),
+            (DownloadError("failed"), 500, "DOWNLOAD_ERROR"),
+            (LanguageDetectionError("failed"), 500, "LANGUAGE_DETECTION_ERROR"),
+            (ReleaseMatchingError("failed"), 500, "RELEASE_MATCHING_ERROR"),
+            (PlexSubtitleError("generic"), 500, "PLEXSUBS_ERROR"),
+            (ValueError("boom"), 500, "INTERNAL_ERROR"),
+        ],
+    )
+    def test_exception_mapping(self, exc, status_code, error_code):
+        """Test exceptions map to their status and error codes."""
+        response = handle_exception(exc)
+        assert response.status_code == status_code
+        assert json.loads(response.body) == {"error": str(exc), "code": error_code}
+
+    def test_subclass_inherits_mapping(self):
+        """Test subclasses of mapped exceptions keep the parent's codes."""
+
+        class CustomPlexError(PlexAPIError):
+            pass
+
+        response = handle_exception(CustomPlexError("down"))
+        assert response.status_code == 503
+        assert json.loads(response.body)["code"] == "PLEX_API_ERROR"
+
+
+class TestCreateErrorResponse:
+    """Tests for create_error_response function."""
+
+    def test_basic_error(self):
+        """Test error body and status derived from message."""
+        response = create_error_response("Subtitle not found", code="NOT_FOUND")
+        assert response.status_code == 404
+        assert json.loads(response.body) == {"error": "Subtitle not found", "code": "NOT_FOUND"}
+
+    def test_details_included_when_set(self):
+        """Test details are only present when provided."""
+        response = create_error_response("Invalid input", details={"field": "language"})
+        assert response.status_code == 400
+        assert json.loads(response.body) == {
+            "error": "Invalid input",
+            "code": "ERROR",
+            "details": {"field": "language"},
+        }
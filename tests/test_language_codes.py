@@ -2,6 +2,7 @@
 
 from plexsubs.utils.language_codes import (
     _resolve_language_code,
+    get_allowed_language_set,
     get_allowed_languages,
     get_supported_languages,
     is_valid_language,
@@ -167,6 +168,26 @@ class TestGetAllowedLanguages:
         assert allowed == [""]
 
 
+class TestGetAllowedLanguageSet:
+    """Tests for get_allowed_language_set function."""
+
+    def test_matches_allowed_languages(self):
+        """Test the set holds the same codes as get_allowed_languages."""
+        assert get_allowed_language_set("nl") == frozenset(get_allowed_languages("nl"))
+
+    def test_returns_frozenset(self):
+        """Test the result is immutable, so sharing the cached value is safe."""
+        assert isinstance(get_allowed_language_set("en"), frozenset)
+
+    def test_cached(self):
+        """Test repeated lookups return the cached set."""
+        assert get_allowed_language_set("de") is get_allowed_language_set("de")
+
+    def test_invalid_code_returns_original(self):
+        """Test that invalid codes map to the lowercased original."""
+        assert get_allowed_language_set("INVALID") == frozenset({"invalid"})
+
+
 class TestVerifyLanguageMatch:
     """Tests for verify_language_match function."""
 
@@ -0,0 +1,119 @@
+"""Tests for subtitle language detection helpers."""
+
+import codecs
+
+from plexsubs.core.language_detector import (
+    _clean_subtitle_text,
+    _decode_subtitle_bytes,
+    _detect_language_cached,
+    detect_subtitle_language,
+)
+
+SAMPLE_SRT = """1
+00:00:01,000 --> 00:00:04,000
+<i>Hello there.</i>
+
+2
+00:00:05,500 --> 00:00:07,250
+How are you doing today?
+
+10
+00:01:00,000 --> 00:01:02,000
+<font color="red">Fine</font>, thanks.
+"""
+
+ENGLISH_SRT = """1
+00:00:01,000 --> 00:00:04,000
+I told you we should have left the house earlier this morning.
+
+2
+00:00:05,000 --> 00:00:08,000
+Now we are going to miss the train and the whole weekend is ruined.
+"""
+
+
+class TestCleanSubtitleText:
+    """Tests for _clean_subtitle_text function."""
+
+    def test_removes_indices_timings_and_tags(self):
+        """Test SRT structure is stripped leaving only dialogue."""
+        assert (
+            _clean_subtitle_text(SAMPLE_SRT)
+            == "Hello there. How are you doing today? Fine, thanks."
+        )
+
+    def test_keeps_numbers_inside_dialogue(self):
+        """Test numbers that are part of dialogue lines are kept."""
+        assert _clean_subtitle_text("1\nI have 2 cats\n") == "I have 2 cats"
+
+    def test_empty_content(self):
+        """Test empty content yields empty text."""
+        assert _clean_subtitle_text("") == ""
+
+    def test_collapses_whitespace(self):
+        """Test runs of whitespace collapse to single spaces."""
+        assert _clean_subtitle_text("  Hello \n\n   world  ") == "Hello world"
+
+
+class TestDetectSubtitleLanguage:
+    """Tests for detect_subtitle_language function."""
+
+    def setup_method(self):
+        """Clear the detection cache between tests."""
+        _detect_language_cached.cache_clear()
+
+    def test_detects_english(self, tmp_path):
+        """Test English dialogue is detected."""
+        path = tmp_path / "movie.srt"
+        path.write_text(ENGLISH_SRT, encoding="utf-8")
+        assert detect_subtitle_language(str(path)) == "en"
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Test missing file returns None instead of raising."""
+        assert detect_subtitle_language(str(tmp_path / "missing.srt")) is None
+
+    def test_too_little_text_returns_none(self, tmp_path):
+        """Test short subtitles are not detected."""
+        path = tmp_path / "short.srt"
+        path.write_text("1\n00:00:01,000 --> 00:00:02,000\nHi\n", encoding="utf-8")
+        assert detect_subtitle_language(str(path)) is None
+
+    def test_unchanged_file_uses_cache(self, tmp_path):
+        """Test repeated detection of an unchanged file hits the cache."""
+        path = tmp_path / "movie.srt"
+        path.write_text(ENGLISH_SRT, encoding="utf-8")
+        detect_subtitle_language(str(path))
+        detect_subtitle_language(str(path))
+        info = _detect_language_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_modified_file_is_redetected(self, tmp_path):
+        """Test a changed file is not served from the cache."""
+        path = tmp_path / "movie.srt"
+        path.write_text(ENGLISH_SRT, encoding="utf-8")
+        detect_subtitle_language(str(path))
+        path.write_text(ENGLISH_SRT + "\nMore lines here.\n", encoding="utf-8")
+        detect_subtitle_language(str(path))
+        assert _detect_language_cached.cache_info().misses == 2
+
+
+class TestDecodeSubtitleBytes:
+    """Tests for _decode_subtitle_bytes function."""
+
+    def test_plain_utf8(self):
+        """Test UTF-8 without BOM."""
+        assert _decode_subtitle_bytes("café".encode()) == "café"
+
+    def test_utf8_bom_stripped(self):
+        """Test the UTF-8 BOM is removed."""
+        assert _decode_subtitle_bytes(codecs.BOM_UTF8 + b"Hello") == "Hello"
+
+    def test_utf16_le_and_be(self):
+        """Test UTF-16 files with either byte order are decoded."""
+        assert _decode_subtitle_bytes(codecs.BOM_UTF16_LE + "Hallo".encode("utf-16-le")) == "Hallo"
+        assert _decode_subtitle_bytes(codecs.BOM_UTF16_BE + "Hallo".encode("utf-16-be")) == "Hallo"
+
+    def test_invalid_bytes_replaced(self):
+        """Test undecodable bytes are replaced rather than dropped."""
+        assert _decode_subtitle_bytes(b"caf\xe9") == "caf�"
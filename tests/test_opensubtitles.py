@@ -0,0 +1,208 @@
+"""Tests for OpenSubtitles authentication and token management."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from plexsubs.providers.base import SubtitleResult
+from plexsubs.providers.opensubtitles import OpenSubtitlesProvider
+from plexsubs.utils.constants import TOKEN_EXPIRY_SECONDS, TOKEN_REFRESH_MARGIN_SECONDS
+from plexsubs.utils.exceptions import DownloadError, OpenSubtitlesError
+
+
+def _login_response(token: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"token": token}
+    return response
+
+
+@pytest.fixture
+def provider():
+    provider = OpenSubtitlesProvider("user", "secret", "key")
+    yield provider
+    provider.close()
+
+
+class TestTokenRefresh:
+    """Tests for the background token refresh."""
+
+    def test_login_schedules_refresh_before_expiry(self, provider):
+        """Test a successful login arms a daemon timer ahead of the token expiry."""
+        with patch.object(provider.session, "post", return_value=_login_response("t1")):
+            assert provider._authenticate() == "t1"
+
+        timer = provider._refresh_timer
+        assert timer is not None and timer.daemon and timer.is_alive()
+        expected = TOKEN_EXPIRY_SECONDS - TOKEN_REFRESH_MARGIN_SECONDS
+        assert expected - 5 <= timer.interval <= expected
+
+    def test_close_cancels_refresh(self, provider):
+        """Test closing the provider stops the pending refresh."""
+        with patch.object(provider.session, "post", return_value=_login_response("t1")):
+            provider._authenticate()
+        timer = provider._refresh_timer
+
+        provider.close()
+
+        assert provider._refresh_timer is None
+        assert timer.finished.is_set()
+
+    def test_clear_token_cancels_refresh(self, provider):
+        """Test dropping the token also stops the pending refresh."""
+        with patch.object(provider.session, "post", return_value=_login_response("t1")):
+            provider._authenticate()
+        timer = provider._refresh_timer
+
+        provider.clear_token()
+
+        assert provider.token is None
+        assert timer.finished.is_set()
+
+    def test_token_stays_usable_during_refresh(self, provider):
+        """Test requests keep the current token while a refresh is in flight."""
+        provider.token = "old"
+        provider._token_expiry = time.time() + 60
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+
+        def slow_login(*args, **kwargs):
+            refresh_started.set()
+            assert release_refresh.wait(timeout=5)
+            return _login_response("new")
+
+        with patch.object(provider.session, "post", side_effect=slow_login) as post:
+            refresher = threading.Thread(target=provider._background_refresh)
+            refresher.start()
+            assert refresh_started.wait(timeout=5)
+
+            assert provider._authenticate() == "old"
+
+            release_refresh.set()
+            refresher.join(timeout=5)
+
+        post.assert_called_once()
+        assert provider.token == "new"
+        assert provider._token_expiry > time.time() + TOKEN_EXPIRY_SECONDS - 60
+
+    def test_failed_refresh_keeps_current_token(self, provider):
+        """Test a failed refresh leaves the still-valid token in place."""
+        provider.token = "old"
+        expiry = time.time() + 60
+        provider._token_expiry = expiry
+
+        error = requests.exceptions.ConnectionError("unreachable")
+        with patch.object(provider.session, "post", side_effect=error):
+            provider._background_refresh()
+
+        assert provider.token == "old"
+        assert provider._token_expiry == expiry
+
+
+class _CountingLock:
+    """Lock wrapper that counts threads that have started waiting to acquire it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self.waiters = 0
+
+    def __enter__(self):
+        with self._count_lock:
+            self.waiters += 1
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class TestAuthenticationSingleFlight:
+    """Tests for coalescing concurrent logins on an expired token."""
+
+    CALLERS = 8
+
+    def _run_callers(self, provider, login):
+        """Call _authenticate from CALLERS threads; the login waits until all are queued."""
+        lock = _CountingLock()
+        provider._token_lock = lock
+        provider.token = "expired"
+        provider._token_expiry = time.time() - 1
+
+        def post(*args, **kwargs):
+            deadline = time.monotonic() + 5
+            while lock.waiters < self.CALLERS and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return login()
+
+        outcomes = [None] * self.CALLERS
+
+        def call(index):
+            try:
+                outcomes[index] = provider._authenticate()
+            except Exception as e:
+                outcomes[index] = e
+
+        with patch.object(provider.session, "post", side_effect=post) as mock_post:
+            threads = [threading.Thread(target=call, args=(i,)) for i in range(self.CALLERS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+
+        assert lock.waiters == self.CALLERS
+        return mock_post, outcomes
+
+    def test_concurrent_callers_share_one_login(self, provider):
+        """Test callers racing on an expired token trigger exactly one login."""
+        mock_post, outcomes = self._run_callers(provider, lambda: _login_response("fresh"))
+
+        mock_post.assert_called_once()
+        assert outcomes == ["fresh"] * self.CALLERS
+
+    def test_failed_login_propagates_to_every_waiter(self, provider):
+        """Test a failed login fails all queued callers without logging in again."""
+
+        def login():
+            raise requests.exceptions.ConnectionError("login refused")
+
+        mock_post, outcomes = self._run_callers(provider, login)
+
+        mock_post.assert_called_once()
+        assert all(isinstance(outcome, OpenSubtitlesError) for outcome in outcomes)
+        assert all("login refused" in str(outcome) for outcome in outcomes)
+        assert provider._auth_error == "login refused"
+
+
+class TestDownload:
+    """Tests for OpenSubtitlesProvider.download."""
+
+    def _subtitle(self):
+        return SubtitleResult("7", "nl", "Movie", "movie.srt", download_params={"file_id": 7})
+
+    def test_transient_fetch_failure_raises_download_error(self, provider, tmp_path):
+        """Test a failed file fetch surfaces as DownloadError for the caller to retry."""
+        error = requests.exceptions.ConnectionError("reset by peer")
+        with (
+            patch.object(provider, "_make_request", return_value={"link": "https://cdn/x"}),
+            patch.object(provider.session, "get", side_effect=error),
+        ):
+            with pytest.raises(DownloadError):
+                provider.download(self._subtitle(), str(tmp_path / "movie.nl.srt"))
+
+    def test_download_streams_file(self, provider, tmp_path):
+        """Test a successful download writes the streamed content."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"1\\n", b"Hallo\\n"]
+        output_path = tmp_path / "movie.nl.srt"
+
+        with (
+            patch.object(provider, "_make_request", return_value={"link": "https://cdn/x"}),
+            patch.object(provider.session, "get", return_value=response),
+        ):
+            assert provider.download(self._subtitle(), str(output_path)) is True
+
+        assert output_path.read_bytes() == b"1\\nHallo\\n"
@@ -0,0 +1,160 @@
+"""Tests for release group extraction and matching."""
+
+from unittest.mock import patch
+
+import pytest
+
+from plexsubs.core.release_matcher import (
+    _fast_release_info,
+    calculate_match_score,
+    extract_release_info,
+)
+
+
+class TestFastReleaseInfo:
+    """Tests for _fast_release_info function."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            (
+                "The.Matrix.1999.1080p.BluRay.x264-SPARKS",
+                ("SPARKS", "1080P", "BLU-RAY", "H.264"),
+            ),
+            (
+                "Show.S01E02.720p.WEB-DL.DDP5.1.H.264-NTb",
+                ("NTB", "720P", "WEB", "H.264"),
+            ),
+            (
+                "Movie.2020.2160p.WEBRip.x265-RARBG",
+                ("RARBG", "2160P", "WEB", "H.265"),
+            ),
+            (
+                "Movie.2020.576p.DVDRip.XviD-aBc",
+                ("ABC", "576P", "DVD", "XVID"),
+            ),
+        ],
+    )
+    def test_scene_names_match_guessit(self, filename, expected):
+        """Test well-formed scene names produce guessit-equivalent values."""
+        assert _fast_release_info(filename) == expected
+
+    def test_missing_field_returns_none(self):
+        """Test names without a screen size defer to guessit."""
+        assert _fast_release_info("Movie 2019 HDTV XviD-FUM") is None
+
+    def test_group_not_after_codec_returns_none(self):
+        """Test trailing tags after the group defer to guessit."""
+        assert _fast_release_info("Movie.2020.720p.HDTV.x264-GRP-xpost") is None
+
+    def test_unknown_codec_returns_none(self):
+        """Test codecs outside the fast path defer to guessit."""
+        assert _fast_release_info("Movie.2020.1080p.BluRay.AV1-GRP") is None
+
+    def test_uhd_qualifier_returns_none(self):
+        """Test UHD sources, which guessit reports as ULTRA HD BLU-RAY, defer to guessit."""
+        assert _fast_release_info("Movie.2020.2160p.UHD.BluRay.HEVC-GRP") is None
+
+    def test_source_named_group_returns_none(self):
+        """Test a release group that looks like a source defers to guessit."""
+        assert _fast_release_info("Movie.2020.1080p.HDTV.x264-WEB") is None
+
+    def test_multiple_sources_return_none(self):
+        """Test names listing several sources defer to guessit."""
+        assert _fast_release_info("Movie.2020.1080p.DVDRip.HDTV.x264-GRP") is None
+
+
+class TestExtractReleaseInfo:
+    """Tests for extract_release_info function."""
+
+    def setup_method(self):
+        """Clear the memoized results between tests."""
+        extract_release_info.cache_clear()
+
+    def test_fast_path_skips_guessit(self):
+        """Test guessit is not called for well-formed scene names."""
+        with patch("guessit.guessit") as mock_guessit:
+            result = extract_release_info("The.Matrix.1999.1080p.BluRay.x264-SPARKS")
+
+        mock_guessit.assert_not_called()
+        assert result == ("SPARKS", "1080P", "BLU-RAY", "H.264")
+
+    def test_falls_back_to_guessit(self):
+        """Test irregular names are parsed by guessit."""
+        assert extract_release_info("Movie 2019 HDTV XviD-FUM") == ("FUM", "HDTV", "XVID")
+
+    def test_results_are_memoized(self):
+        """Test guessit runs once per unique filename."""
+        with patch("guessit.guessit", return_value={"release_group": "FUM"}) as m:
+            extract_release_info("Movie 2019 HDTV XviD-FUM")
+            result = extract_release_info("Movie 2019 HDTV XviD-FUM")
+
+        m.assert_called_once()
+        assert result == ("FUM",)
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            "The.Matrix.1999.1080p.BluRay.x264-SPARKS",
+            "Movie.2020.1080p.WEBRip.x264-GRP",
+            "Movie.2020.2160p.UHD.BluRay.HEVC-GRP",
+            "Movie.2020.1080p.Ultra.HD.BluRay.x265-GRP",
+            "Movie.2020.1080p.BluRay.REMUX.AVC-GRP",
+            "Movie.2020.1080p.HDTV.x264-WEB",
+            "Movie.2020.1080p.WEB.x264-WEBRip",
+            "Movie.2020.1080p.DVDRip.HDTV.x264-GRP",
+        ],
+    )
+    def test_fast_path_matches_guessit(self, filename):
+        """Test the fast path reports exactly what guessit would."""
+        with patch("plexsubs.core.release_matcher._fast_release_info", return_value=None):
+            expected = extract_release_info(filename)
+        extract_release_info.cache_clear()
+
+        assert extract_release_info(filename) == expected
+
+
+class TestCalculateMatchScore:
+    """Tests for calculate_match_score function."""
+
+    def test_perfect_match(self):
+        """Test all groups found gives a perfect match."""
+        score, is_perfect = calculate_match_score(
+            "The.Matrix.1999.1080p.BluRay.x264-SPARKS",
+            "the.matrix.1999.1080p.bluray.x264-sparks.srt",
+            ("SPARKS", "1080P"),
+        )
+        assert score == 1.0
+        assert is_perfect is True
+
+    def test_partial_match(self):
+        """Test partial matches are scored proportionally."""
+        score, is_perfect = calculate_match_score(
+            "The.Matrix.1999.720p.BluRay.x264-SPARKS", "", ("SPARKS", "1080P")
+        )
+        assert score == 0.5
+        assert is_perfect is False
+
+    def test_group_must_be_whole_token(self):
+        """Test short groups do not match inside longer words."""
+        score, _ = calculate_match_score("Movie.2020.1080p.WEB-DL-SPARKSTEAM", "", ("SPARKS",))
+        assert score == 0.0
+
+    def test_groups_with_separators_use_substring(self):
+        """Test canonical values like H.264 still match."""
+        _, is_perfect = calculate_match_score("Movie.2020.1080p.WEB.H.264-NTb", "", ("H.264",))
+        assert is_perfect is True
+
+    def test_no_media_groups(self):
+        """Test empty release groups yields zero score."""
+        assert calculate_match_score("anything", "anything.srt", ()) == (0.0, False)
+
+    def test_rip_tokens_match_canonical_source(self):
+        """Test WEBRip/DVDRip subtitles match the canonical WEB/DVD source."""
+        score, _ = calculate_match_score(
+            "Movie.2020.1080p.WEBRip.x264-GRP", "", ("GRP", "1080P", "WEB", "H.264")
+        )
+        assert score == 0.75
+
+        score, _ = calculate_match_score("Movie.2020.DVDRip.XviD-GRP", "", ("GRP", "DVD"))
+        assert score == 1.0
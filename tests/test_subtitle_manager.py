@@ -0,0 +1,382 @@
+"""Tests for the subtitle manager download flow."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plexsubs.core.subtitle_manager import SubtitleManager
+from plexsubs.providers.base import SubtitleResult
+from plexsubs.utils.constants import SEARCH_MISS_TTL_SECONDS
+from plexsubs.utils.exceptions import DownloadError, ProviderError
+
+MEDIA_NAME = "Movie.2020.1080p.BluRay.x264-GRP"
+
+
+def _make_manager(languages=("nl", "en")) -> SubtitleManager:
+    settings = MagicMock(
+        languages_list=languages,
+        subtitles_use_release_matching=False,
+        subtitles_upgrade_on_perfect_match=True,
+        subtitles_upgrade_on_popular=False,
+        subtitles_popular_download_threshold=100,
+    )
+    with patch.object(SubtitleManager, "_init_providers"):
+        return SubtitleManager(settings)
+
+
+def _writing_provider(content: bytes = b"1\n00:00:01,000 --> 00:00:02,000\nHallo\n"):
+    def download(subtitle, path, token):
+        with open(path, "wb") as f:
+            f.write(content)
+        return True
+
+    provider = MagicMock()
+    provider.name = "fake"
+    provider.download.side_effect = download
+    return provider
+
+
+def _searching_provider(search):
+    """Build a provider whose search(language) is answered by ``search``."""
+    provider = _writing_provider()
+    provider.search.side_effect = lambda language, **kwargs: (search(language), "token")
+    return provider
+
+
+def _result(language: str) -> SubtitleResult:
+    return SubtitleResult(f"id-{language}", language, MEDIA_NAME, f"movie.{language}.srt")
+
+
+@pytest.fixture
+def media_path(tmp_path):
+    path = tmp_path / f"{MEDIA_NAME}.mkv"
+    path.touch()
+    return str(path)
+
+
+class TestDownloadAndVerify:
+    """Tests for SubtitleManager._download_and_verify."""
+
+    def setup_method(self):
+        """Create a manager without real providers."""
+        self.manager = _make_manager()
+        self.subtitle = SubtitleResult("1", "nl", MEDIA_NAME, "movie.srt")
+
+    def test_success_renames_temp_file_atomically(self, tmp_path):
+        """Test the verified temp file is moved onto the final name with os.replace."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        provider = _writing_provider(b"subtitle")
+
+        replace = MagicMock(wraps=os.replace)
+        with (
+            patch("plexsubs.core.subtitle_manager.verify_language", return_value=True),
+            patch("plexsubs.core.subtitle_manager.os.replace", replace),
+        ):
+            downloaded = self.manager._download_and_verify(
+                provider, self.subtitle, output_path, None, "nl"
+            )
+
+        assert downloaded
+        part_path = provider.download.call_args[0][1]
+        replace.assert_called_once_with(part_path, output_path)
+        assert os.path.dirname(part_path) == str(tmp_path)
+        assert part_path.endswith(".part")
+        assert os.listdir(tmp_path) == [f"{MEDIA_NAME}.nl.srt"]
+        with open(output_path, "rb") as f:
+            assert f.read() == b"subtitle"
+        # Created with the process umask applied, like any other new file
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert os.stat(output_path).st_mode & 0o777 == 0o666 & ~umask
+
+    def test_failed_download_removes_temp_file(self, tmp_path):
+        """Test a provider failure mid-download leaves nothing behind."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        provider = _writing_provider()
+        provider.download.side_effect = ProviderError("connection dropped")
+
+        with pytest.raises(ProviderError):
+            self.manager._download_and_verify(provider, self.subtitle, output_path, None, "nl")
+
+        assert os.listdir(tmp_path) == []
+
+    def test_unsuccessful_download_removes_temp_file(self, tmp_path):
+        """Test a download reporting failure leaves nothing behind."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        provider = _writing_provider()
+        provider.download.side_effect = lambda subtitle, path, token: False
+
+        assert not self.manager._download_and_verify(
+            provider, self.subtitle, output_path, None, "nl"
+        )
+        assert os.listdir(tmp_path) == []
+
+    def test_verification_failure_leaves_no_file(self, tmp_path):
+        """Test a wrong-language subtitle is neither kept nor renamed."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        with patch("plexsubs.core.subtitle_manager.verify_language", return_value=False):
+            result = self.manager._download_with_retry(
+                _writing_provider(), self.subtitle, output_path, None, "nl", None
+            )
+
+        assert result == {"success": False}
+        assert os.listdir(tmp_path) == []
+
+    def test_transient_failure_is_retried(self, tmp_path):
+        """Test a download that fails transiently once is retried and succeeds."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        provider = _writing_provider(b"subtitle")
+        write = provider.download.side_effect
+        attempts = []
+
+        def flaky_download(subtitle, path, token):
+            attempts.append(path)
+            if len(attempts) == 1:
+                raise DownloadError("connection reset")
+            return write(subtitle, path, token)
+
+        provider.download.side_effect = flaky_download
+
+        with (
+            patch("plexsubs.core.subtitle_manager.verify_language", return_value=True),
+            patch("plexsubs.utils.retry.time.sleep") as sleep,
+        ):
+            result = self.manager._download_with_retry(
+                provider, self.subtitle, output_path, None, "nl", None
+            )
+
+        assert result["success"] is True
+        assert len(attempts) == 2
+        sleep.assert_called_once()
+        assert os.listdir(tmp_path) == [f"{MEDIA_NAME}.nl.srt"]
+
+    def test_concurrent_downloads_use_distinct_temp_files(self, tmp_path):
+        """Test two simultaneous downloads of the same subtitle never share a temp file."""
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        both_writing = threading.Barrier(2, timeout=5)
+        part_paths = []
+
+        def download(subtitle, path, token):
+            part_paths.append(path)
+            with open(path, "wb") as f:
+                f.write(b"partial")
+                both_writing.wait()
+                f.write(b" done")
+            return True
+
+        provider = MagicMock()
+        provider.download.side_effect = download
+
+        with patch("plexsubs.core.subtitle_manager.verify_language", return_value=True):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [
+                    pool.submit(
+                        self.manager._download_and_verify,
+                        provider,
+                        self.subtitle,
+                        output_path,
+                        None,
+                        "nl",
+                    )
+                    for _ in range(2)
+                ]
+                assert all(future.result() for future in futures)
+
+        assert len(set(part_paths)) == 2
+        assert os.listdir(tmp_path) == [f"{MEDIA_NAME}.nl.srt"]
+        with open(output_path, "rb") as f:
+            assert f.read() == b"partial done"
+
+
+class TestLanguageSearch:
+    """Tests for the concurrent per-language search in download_subtitles."""
+
+    def setup_method(self):
+        """Accept every downloaded file as the expected language."""
+        self.verify = patch("plexsubs.core.subtitle_manager.verify_language", return_value=True)
+        self.verify.start()
+
+    def teardown_method(self):
+        """Restore language verification."""
+        self.verify.stop()
+
+    def test_priority_kept_when_later_language_finishes_first(self, media_path):
+        """Test the first configured language wins even if its search is slowest."""
+        en_done = threading.Event()
+
+        def search(language):
+            if language == "nl":
+                assert en_done.wait(timeout=5)
+            else:
+                en_done.set()
+            return [_result(language)]
+
+        manager = _make_manager(("nl", "en"))
+        manager.providers = [_searching_provider(search)]
+
+        result = manager.download_subtitles(media_path, "Movie", 2020)
+
+        assert result["success"] is True
+        assert result["language"] == "nl"
+
+    def test_early_return_cancels_pending_searches(self, media_path):
+        """Test searches still queued when a language succeeds are never run."""
+        release_en = threading.Event()
+        de_started = threading.Event()
+
+        def search(language):
+            if language == "en":
+                assert release_en.wait(timeout=5)
+            elif language == "de":
+                de_started.set()
+            return [_result(language)] if language == "nl" else []
+
+        manager = _make_manager(("nl", "en", "de"))
+        manager.providers = [_searching_provider(search)]
+
+        # One worker: en occupies it while de waits in the queue
+        with patch("plexsubs.core.subtitle_manager._MAX_LANGUAGE_SEARCHES", 1):
+            result = manager.download_subtitles(media_path, "Movie", 2020)
+        release_en.set()
+
+        assert result["language"] == "nl"
+        assert not de_started.wait(timeout=0.2)
+
+    def test_provider_error_in_one_language_spares_the_others(self, media_path):
+        """Test a failing search for one language still lets the next succeed."""
+
+        def search(language):
+            if language == "nl":
+                raise ProviderError("rate limited")
+            return [_result(language)]
+
+        manager = _make_manager(("nl", "en"))
+        manager.providers = [_searching_provider(search)]
+
+        result = manager.download_subtitles(media_path, "Movie", 2020)
+
+        assert result["success"] is True
+        assert result["language"] == "en"
+
+
+class TestSearchMissCache:
+    """Tests for the search-miss cache in _search_providers."""
+
+    def _search(self, manager, language="nl"):
+        return manager._search_providers(
+            title="Movie",
+            year=2020,
+            imdb_id="tt0000001",
+            language=language,
+            release_groups=None,
+            media_name=MEDIA_NAME,
+        )
+
+    def test_cached_miss_skips_provider(self):
+        """Test a repeated search after an empty answer does not call the provider."""
+        manager = _make_manager()
+        provider = _searching_provider(lambda language: [])
+        manager.providers = [provider]
+
+        assert self._search(manager) == []
+        assert self._search(manager) == []
+
+        provider.search.assert_called_once()
+
+    def test_miss_is_per_language(self):
+        """Test a miss for one language does not suppress another."""
+        manager = _make_manager()
+        provider = _searching_provider(lambda language: [])
+        manager.providers = [provider]
+
+        self._search(manager, "nl")
+        self._search(manager, "en")
+
+        assert provider.search.call_count == 2
+
+    def test_provider_errors_are_not_cached(self):
+        """Test a failed search is retried on the next webhook."""
+        manager = _make_manager()
+        provider = _searching_provider(lambda language: [])
+        provider.search.side_effect = ProviderError("unavailable")
+        manager.providers = [provider]
+
+        self._search(manager)
+        self._search(manager)
+
+        assert provider.search.call_count == 2
+
+    def test_miss_expires(self):
+        """Test the provider is searched again once the miss has expired."""
+        manager = _make_manager()
+        provider = _searching_provider(lambda language: [])
+        manager.providers = [provider]
+
+        with patch("plexsubs.core.subtitle_manager.time.monotonic", return_value=1000.0):
+            self._search(manager)
+            self._search(manager)
+        expired = 1000.0 + SEARCH_MISS_TTL_SECONDS
+        with patch("plexsubs.core.subtitle_manager.time.monotonic", return_value=expired):
+            self._search(manager)
+
+        assert provider.search.call_count == 2
+        assert manager._search_misses[("tt0000001", "nl")] > expired
+
+    def test_oldest_miss_evicted_at_capacity(self):
+        """Test the cache stays bounded by dropping its oldest entry."""
+        manager = _make_manager()
+
+        with patch("plexsubs.core.subtitle_manager.SEARCH_MISS_CACHE_SIZE", 2):
+            for media in ("a", "b", "c"):
+                manager._record_search_miss((media, "nl"))
+
+        assert list(manager._search_misses) == [("b", "nl"), ("c", "nl")]
+        assert not manager._is_search_miss(("a", "nl"))
+        assert manager._is_search_miss(("c", "nl"))
+
+
+class TestDirectorySnapshots:
+    """Tests for the cached directory listings behind _get_existing_subtitles."""
+
+    def test_unchanged_directory_is_not_rescanned(self, tmp_path):
+        """Test a directory whose mtime has not moved reuses its listing."""
+        manager = _make_manager()
+        (tmp_path / f"{MEDIA_NAME}.nl.srt").touch()
+
+        manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME)
+        with patch("plexsubs.core.subtitle_manager.os.scandir") as scandir:
+            existing = manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME)
+
+        scandir.assert_not_called()
+        assert existing == {"nl": str(tmp_path / f"{MEDIA_NAME}.nl.srt")}
+
+    def test_changed_mtime_rescans(self, tmp_path):
+        """Test files added by others are seen once the directory mtime moves."""
+        manager = _make_manager()
+        assert manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME) == {}
+
+        (tmp_path / f"{MEDIA_NAME}.en.srt").touch()
+        mtime_ns = os.stat(tmp_path).st_mtime_ns + 1_000_000_000
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+
+        assert "en" in manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME)
+
+    def test_own_download_seen_within_same_mtime_tick(self, tmp_path):
+        """Test a subtitle this process wrote is listed even if the mtime did not move."""
+        manager = _make_manager()
+        assert manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME) == {}
+        mtime_ns = os.stat(tmp_path).st_mtime_ns
+        output_path = str(tmp_path / f"{MEDIA_NAME}.nl.srt")
+        subtitle = SubtitleResult("1", "nl", MEDIA_NAME, "movie.srt")
+
+        with patch("plexsubs.core.subtitle_manager.verify_language", return_value=True):
+            assert manager._download_and_verify(
+                _writing_provider(), subtitle, output_path, None, "nl"
+            )
+        # Simulate a filesystem whose timestamp granularity hides the write
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+
+        assert manager._get_existing_subtitles(str(tmp_path), MEDIA_NAME) == {"nl": output_path}
@@ -0,0 +1,101 @@
+"""Tests for Plex webhook request parsing and event handling."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from plexsubs.plex.webhook import WebhookHandler, extract_webhook_payload
+
+PAYLOAD = b'{"event": "media.play", "Metadata": {"ratingKey": "42"}}'
+
+
+def _multipart(*parts: tuple[str, bytes], boundary: str = "XyZ") -> tuple[bytes, str]:
+    body = b""
+    for disposition, content in parts:
+        body += f"--{boundary}\r\nContent-Disposition: form-data; {disposition}\r\n".encode()
+        body += b"\r\n" + content + b"\r\n"
+    body += f"--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+class TestExtractWebhookPayload:
+    """Tests for extract_webhook_payload function."""
+
+    def test_multipart_payload(self):
+        """Test the payload field is extracted from a Plex multipart body."""
+        body, content_type = _multipart(('name="payload"', PAYLOAD))
+        assert extract_webhook_payload(body, content_type) == PAYLOAD
+
+    def test_multipart_with_thumbnail(self):
+        """Test the thumbnail part is skipped, whatever its order."""
+        thumb = ('name="thumb"; filename="payload"', b"\xff\xd8\r\n\r\n\xff\xd9")
+        body, content_type = _multipart(thumb, ('name="payload"', PAYLOAD))
+        assert extract_webhook_payload(body, content_type) == PAYLOAD
+
+    def test_quoted_boundary(self):
+        """Test quoted boundary parameters are supported."""
+        body, _ = _multipart(('name="payload"', PAYLOAD), boundary="a-b")
+        content_type = 'multipart/form-data; boundary="a-b"'
+        assert extract_webhook_payload(body, content_type) == PAYLOAD
+
+    def test_multipart_without_payload(self):
+        """Test a multipart body without a payload field."""
+        body, content_type = _multipart(('name="other"', b"x"))
+        assert extract_webhook_payload(body, content_type) is None
+
+    def test_multipart_without_boundary(self):
+        """Test a multipart content type missing its boundary."""
+        assert extract_webhook_payload(b"anything", "multipart/form-data") is None
+
+    def test_urlencoded_payload(self):
+        """Test URL-encoded form bodies."""
+        body = b"payload=%7B%22event%22%3A%22media.pause%22%7D"
+        content_type = "application/x-www-form-urlencoded"
+        assert extract_webhook_payload(body, content_type) == b'{"event":"media.pause"}'
+
+    def test_raw_json_body(self):
+        """Test bare JSON bodies are used as the payload."""
+        assert extract_webhook_payload(PAYLOAD, "application/json") == PAYLOAD
+
+    def test_empty_body(self):
+        """Test empty bodies have no payload."""
+        assert extract_webhook_payload(b"", "application/json") is None
+        assert extract_webhook_payload(b"", "application/x-www-form-urlencoded") is None
+
+
+class TestHandleEvent:
+    """Tests for WebhookHandler.handle_event filtering."""
+
+    @pytest.fixture
+    def handler(self):
+        """Create a handler whose Plex client must not be called."""
+        plex = MagicMock()
+        plex.get_media_info.side_effect = AssertionError("unexpected Plex call")
+        return WebhookHandler(MagicMock(), plex, MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_ignored_event(self, handler):
+        """Test ignored events are answered from the raw payload."""
+        payload = b'{"event":"media.scrobble","Metadata":{"ratingKey":"42"}}'
+        assert await handler.handle_event(payload) == (
+            {"status": "ignored", "event": "media.scrobble"},
+            200,
+        )
+
+    @pytest.mark.asyncio
+    async def test_ignored_event_from_str(self, handler):
+        """Test str payloads are accepted."""
+        response, status = await handler.handle_event('{"event": "media.pause"}')
+        assert (response["event"], status) == ("media.pause", 200)
+
+    @pytest.mark.asyncio
+    async def test_invalid_json(self, handler):
+        """Test payloads that are not JSON are rejected."""
+        response, status = await handler.handle_event(b"not json")
+        assert (response["message"], status) == ("Invalid JSON", 400)
+
+    @pytest.mark.asyncio
+    async def test_processable_event_without_rating_key(self, handler):
+        """Test processable events are fully decoded."""
+        response, status = await handler.handle_event(b'{"event":"media.play","Metadata":{}}')
+        assert (response["message"], status) == ("No rating key", 400)
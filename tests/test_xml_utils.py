@@ -2,6 +2,8 @@
 
 import xml.etree.ElementTree as ET
 
+import pytest
+
 from plexsubs.utils.xml_utils import (
     MediaPartData,
     MediaPartNavigator,
@@ -14,6 +16,7 @@ from plexsubs.utils.xml_utils import (
     find_video_element,
     get_file_path_from_video,
     get_part_id_from_video,
+    iter_xml_elements,
     parse_xml_response,
 )
 
@@ -52,6 +55,63 @@ class TestParseXmlResponse:
         assert result is not None
         assert result.get("title") == "Test & Example"
 
+    def test_bytes_with_encoding_declaration(self):
+        """Test parsing raw bytes with an XML declaration."""
+        xml = b'<?xml version="1.0" encoding="UTF-8"?><MediaContainer size="0"/>'
+        result = parse_xml_response(xml)
+        assert result is not None
+        assert result.tag == "MediaContainer"
+
+    def test_control_characters_stripped_on_failure(self):
+        """Test XML with forbidden control characters is cleaned and parsed."""
+        xml = '<Video title="Bad\x0bTitle\x1f"/>'
+        result = parse_xml_response(xml)
+        assert result is not None
+        assert result.get("title") == "BadTitle"
+
+
+class TestIterXmlElements:
+    """Tests for iter_xml_elements function."""
+
+    def test_yields_matching_elements(self):
+        """Test each element with the tag is yielded with its subtree."""
+        xml = (
+            b'<MediaContainer><Video ratingKey="1"><Session id="a"/></Video>'
+            b'<Directory/><Video ratingKey="2"><Session id="b"/></Video></MediaContainer>'
+        )
+        seen = [
+            (video.get("ratingKey"), find_session_element(video).get("id"))
+            for video in iter_xml_elements(xml, "Video")
+        ]
+        assert seen == [("1", "a"), ("2", "b")]
+
+    def test_elements_cleared_after_use(self):
+        """Test yielded elements are cleared once iteration moves on."""
+        xml = b'<MediaContainer><Video ratingKey="1"/><Video ratingKey="2"/></MediaContainer>'
+        videos = list(iter_xml_elements(xml, "Video"))
+        assert [video.get("ratingKey") for video in videos] == [None, None]
+
+    def test_no_matches(self):
+        """Test XML without the tag yields nothing."""
+        assert list(iter_xml_elements(b"<MediaContainer/>", "Video")) == []
+
+    def test_malformed_xml(self):
+        """Test malformed XML raises a parse error."""
+        with pytest.raises(SyntaxError):
+            list(iter_xml_elements(b"<MediaContainer><Video>", "Video"))
+
+    def test_control_characters_stripped_on_failure(self):
+        """Test a body with a stray control character still parses."""
+        xml = (
+            b'<MediaContainer><Video ratingKey="1" title="ok"/>'
+            b'<Video ratingKey="2" title="bad\x01title"/></MediaContainer>'
+        )
+        seen = [
+            (video.get("ratingKey"), video.get("title"))
+            for video in iter_xml_elements(xml, "Video")
+        ]
+        assert seen == [("1", "ok"), ("2", "badtitle")]
+
 
 class TestFindVideoElement:
     """Tests for find_video_element function."""